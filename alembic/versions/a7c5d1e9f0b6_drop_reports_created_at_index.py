@@ -0,0 +1,38 @@
+"""drop reports created_at index
+
+Revision ID: a7c5d1e9f0b6
+Revises: e5a3b9c6f7d4
+Create Date: 2026-10-14 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c5d1e9f0b6'
+down_revision: Union[str, None] = 'e5a3b9c6f7d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Reports are listed by id, no query reads this index
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_reports_created_at',
+            table_name='reports',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reports_created_at',
+            'reports',
+            [sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,52 @@
+"""convert report sections to json
+
+Revision ID: c3e1f7a9d4b2
+Revises: b8d95e3f3998
+Create Date: 2026-10-14 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e1f7a9d4b2'
+down_revision: Union[str, None] = 'b8d95e3f3998'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = ('topics', 'decisions', 'action_items')
+
+
+def upgrade() -> None:
+    # SQLite stores JSON as TEXT already, only PostgreSQL needs a new type
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'reports',
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.Text(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'reports',
+            column,
+            type_=sa.Text(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f'{column}::text',
+        )
@@ -0,0 +1,48 @@
+"""add reports listing indexes
+
+Revision ID: d4f2a8b5e6c3
+Revises: c3e1f7a9d4b2
+Create Date: 2026-10-14 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f2a8b5e6c3'
+down_revision: Union[str, None] = 'c3e1f7a9d4b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IN_PROGRESS = sa.text("status IN ('pending', 'transcribing', 'summarizing')")
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reports_created_at',
+            'reports',
+            [sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_reports_status_pending',
+            'reports',
+            ['created_at'],
+            postgresql_where=IN_PROGRESS,
+            sqlite_where=IN_PROGRESS,
+            postgresql_concurrently=True,
+        )
+
+    # Redundant with the primary key index
+    op.drop_index('ix_reports_id', table_name='reports')
+
+
+def downgrade() -> None:
+    op.create_index('ix_reports_id', 'reports', ['id'], unique=False)
+    op.drop_index('ix_reports_status_pending', table_name='reports')
+    op.drop_index('ix_reports_created_at', table_name='reports')
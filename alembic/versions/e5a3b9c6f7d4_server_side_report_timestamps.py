@@ -0,0 +1,73 @@
+"""server side report timestamps
+
+Revision ID: e5a3b9c6f7d4
+Revises: d4f2a8b5e6c3
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a3b9c6f7d4'
+down_revision: Union[str, None] = 'd4f2a8b5e6c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
+
+
+def _is_sqlite() -> bool:
+    return op.get_context().dialect.name == 'sqlite'
+
+
+def _drop_created_at_index() -> None:
+    # The SQLite table rebuild reflects indexes without their DESC ordering
+    if _is_sqlite():
+        op.drop_index('ix_reports_created_at', table_name='reports')
+
+
+def _create_created_at_index() -> None:
+    if _is_sqlite():
+        op.create_index(
+            'ix_reports_created_at', 'reports', [sa.text('created_at DESC')]
+        )
+
+
+def upgrade() -> None:
+    _drop_created_at_index()
+
+    # Batch mode rebuilds the table on SQLite, which cannot alter columns
+    with op.batch_alter_table('reports') as batch_op:
+        for column in TIMESTAMP_COLUMNS:
+            # Existing naive values were written with datetime.utcnow()
+            batch_op.alter_column(
+                column,
+                type_=sa.DateTime(timezone=True),
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                server_default=sa.func.now(),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+    _create_created_at_index()
+
+
+def downgrade() -> None:
+    _drop_created_at_index()
+
+    with op.batch_alter_table('reports') as batch_op:
+        for column in TIMESTAMP_COLUMNS:
+            batch_op.alter_column(
+                column,
+                type_=sa.DateTime(),
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                server_default=None,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+    _create_created_at_index()
@@ -0,0 +1,38 @@
+"""add report content hash
+
+Revision ID: f6b4c0d8e9a5
+Revises: a7c5d1e9f0b6
+Create Date: 2026-10-14 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b4c0d8e9a5'
+down_revision: Union[str, None] = 'a7c5d1e9f0b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing reports keep a NULL hash, NULLs never conflict in the index
+    op.add_column('reports', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_reports_content_hash',
+            'reports',
+            ['content_hash'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_content_hash', table_name='reports')
+    op.drop_column('reports', 'content_hash')
@@ -2,22 +2,23 @@
 API endpoints for report generation.
 """
 
-import json
-from typing import List
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+import asyncio
+import os
+from typing import AsyncIterator, Optional, Tuple
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Request, Response, status
 from fastapi.responses import FileResponse
+from fastapi.sse import EventSourceResponse, ServerSentEvent
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db
+from app.models.report import Report
 from app.schemas.report import (
     ReportResponse,
+    ReportListItemResponse,
     ReportListResponse,
     TranscriptionResponse,
     SummaryResponse,
-    GenerateReportRequest,
-    Topic,
-    Decision,
-    ActionItem
+    GenerateReportRequest
 )
 from app.services.report import report_service
 from app.utils.file_handler import file_handler
@@ -25,6 +26,89 @@ from app.schemas.report import ReportCreate
 
 router = APIRouter()
 
+# Statuses of reports whose pipeline is running
+IN_PROGRESS_STATUSES = frozenset({"transcribing", "summarizing"})
+
+# Fields copied from the ORM rows into listing items
+LIST_ITEM_FIELDS = tuple(ReportListItemResponse.model_fields)
+
+
+def _build_list_item(report: Report) -> ReportListItemResponse:
+    """Build a listing item from a trusted database row without validation."""
+    return ReportListItemResponse.model_construct(
+        **{field: getattr(report, field) for field in LIST_ITEM_FIELDS}
+    )
+
+
+def _summary_response(report: Report) -> SummaryResponse:
+    """Build the structured summary of a summarized report."""
+    return SummaryResponse(
+        report_id=report.id,
+        summary=report.summary or "",
+        topics=report.topics or [],
+        decisions=report.decisions or [],
+        action_items=report.action_items or []
+    )
+
+
+def _report_etag(report: Report, version: str) -> str:
+    """Weak ETag of the exports of a report, from its export version."""
+    return f'W/"{report.id}-{version}"'
+
+
+def _opaque_tag(etag: str) -> str:
+    """Strip the weakness indicator of an ETag."""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check if the If-None-Match header of a request matches an ETag.
+    
+    If-None-Match uses the weak comparison: W/"x" and "x" match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    opaque = _opaque_tag(etag)
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(_opaque_tag(c) == opaque for c in candidates)
+
+
+def _cache_headers(etag: str) -> dict:
+    """Headers making clients revalidate exports with a conditional GET."""
+    return {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+
+
+async def _save_and_create_report(
+    file: UploadFile,
+    db: AsyncSession
+) -> Tuple[Report, bool]:
+    """
+    Save an uploaded audio file and create its report.
+    
+    When a report already exists for the same audio, the new copy is
+    deleted and the existing report is returned instead.
+    
+    Returns:
+        Tuple of (report, whether it was created)
+    """
+    file_path, original_filename, file_size, content_hash = (
+        await file_handler.save_upload_file(file, subdirectory="audio")
+    )
+    
+    report_data = ReportCreate(
+        original_filename=original_filename,
+        file_path=file_path,
+        file_size=file_size,
+        content_hash=content_hash
+    )
+    report, created = await report_service.create_or_get_report(db, report_data)
+    if not created:
+        await file_handler.delete_file(file_path)
+    
+    return report, created
+
 
 @router.post(
     "/upload",
@@ -33,6 +117,7 @@ router = APIRouter()
     summary="Upload an audio file"
 )
 async def upload_audio(
+    response: Response,
     file: UploadFile = File(..., description="Audio file to transcribe"),
     db: AsyncSession = Depends(get_db)
 ) -> ReportResponse:
@@ -41,22 +126,13 @@ async def upload_audio(
     
     - **file**: Audio file (mp3, wav, m4a, ogg, webm)
     
-    Returns the created report with pending status.
+    Returns the created report with pending status. Uploading the same
+    audio again returns the existing report with a 200 status.
     """
     try:
-        # Save uploaded file
-        file_path, original_filename, file_size = await file_handler.save_upload_file(
-            file, subdirectory="audio"
-        )
-        
-        # Create report in database
-        report_data = ReportCreate(
-            original_filename=original_filename,
-            file_path=file_path,
-            file_size=file_size
-        )
-        
-        report = await report_service.create_report(db, report_data)
+        report, created = await _save_and_create_report(file, db)
+        if not created:
+            response.status_code = status.HTTP_200_OK
         
         return ReportResponse.model_validate(report)
     
@@ -128,29 +204,7 @@ async def generate_summary(
     try:
         report = await report_service.generate_summary(db, report_id)
         
-        # Parse JSON fields
-        topics = []
-        if report.topics:
-            topics_data = json.loads(report.topics)
-            topics = [Topic(**t) for t in topics_data]
-        
-        decisions = []
-        if report.decisions:
-            decisions_data = json.loads(report.decisions)
-            decisions = [Decision(**d) for d in decisions_data]
-        
-        action_items = []
-        if report.action_items:
-            action_items_data = json.loads(report.action_items)
-            action_items = [ActionItem(**a) for a in action_items_data]
-        
-        return SummaryResponse(
-            report_id=report.id,
-            summary=report.summary or "",
-            topics=topics,
-            decisions=decisions,
-            action_items=action_items
-        )
+        return _summary_response(report)
     
     except ValueError as e:
         raise HTTPException(
@@ -164,6 +218,61 @@ async def generate_summary(
         )
 
 
+async def _transcribed_report(
+    report_id: int,
+    db: AsyncSession = Depends(get_db)
+) -> Report:
+    """Load a report that can be summarized, before any streaming starts."""
+    report = await report_service.get_report(db, report_id)
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+    if not report.transcription:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report must be transcribed first"
+        )
+    return report
+
+
+@router.post(
+    "/{report_id}/summarize/stream",
+    response_class=EventSourceResponse,
+    summary="Generate summary for a report, streaming the output"
+)
+async def stream_summary(
+    report: Report = Depends(_transcribed_report),
+    db: AsyncSession = Depends(get_db)
+) -> AsyncIterator[ServerSentEvent]:
+    """
+    Generate a summary from the transcription as Server-Sent Events.
+    
+    - **report_id**: ID of the report to summarize
+    
+    Emits `delta` events with chunks of the JSON summary as the model writes
+    them, then one `summary` event with the stored structured summary (or an
+    `error` event if generation failed).
+    """
+    summary_stream = report_service.stream_summary(db, report)
+    try:
+        async for chunk in summary_stream:
+            yield ServerSentEvent(data=chunk, event="delta")
+    except Exception as e:
+        yield ServerSentEvent(
+            data={"detail": str(e)},
+            event="error"
+        )
+        return
+    finally:
+        # Close the service stream right away when the client disconnects,
+        # so it resets the report instead of waiting for garbage collection
+        await summary_stream.aclose()
+    
+    yield ServerSentEvent(data=_summary_response(report), event="summary")
+
+
 @router.post(
     "/generate",
     response_model=ReportResponse,
@@ -171,6 +280,7 @@ async def generate_summary(
     summary="Upload and process audio file completely"
 )
 async def generate_complete_report(
+    response: Response,
     file: UploadFile = File(..., description="Audio file to process"),
     language: str = None,
     include_summary: bool = True,
@@ -184,21 +294,31 @@ async def generate_complete_report(
     - **include_summary**: Whether to generate summary (default: true)
     
     This is a convenience endpoint that combines upload, transcribe, and summarize.
+    Audio that was already uploaded returns its existing report with a 200
+    status. Only the missing steps are run, and a report that is still
+    being processed is returned as it is.
     """
     try:
-        # Save uploaded file
-        file_path, original_filename, file_size = await file_handler.save_upload_file(
-            file, subdirectory="audio"
-        )
-        
-        # Create report in database
-        report_data = ReportCreate(
-            original_filename=original_filename,
-            file_path=file_path,
-            file_size=file_size
-        )
-        
-        report = await report_service.create_report(db, report_data)
+        report, created = await _save_and_create_report(file, db)
+        if not created:
+            response.status_code = status.HTTP_200_OK
+            # Another request is processing the same audio, don't race it
+            if report.status in IN_PROGRESS_STATUSES:
+                return ReportResponse.model_validate(report)
+            
+            # Only run the steps the same audio has not been through yet
+            if report.status == "transcribed":
+                if (include_summary and report.transcription
+                        and await report_service.claim_report(db, report, "summarizing")):
+                    report = await report_service.generate_summary(db, report.id)
+                return ReportResponse.model_validate(report)
+            if report.status == "completed":
+                return ReportResponse.model_validate(report)
+            
+            # Pending or failed: start the pipeline, unless a concurrent
+            # request for the same audio just did
+            if not await report_service.claim_report(db, report, "transcribing"):
+                return ReportResponse.model_validate(report)
         
         # Process complete report
         report = await report_service.process_complete_report(
@@ -251,22 +371,34 @@ async def get_report(
 async def list_reports(
     skip: int = 0,
     limit: int = 100,
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
-) -> ReportListResponse:
+) -> Response:
     """
-    List all reports with pagination.
+    List all reports with pagination, newest first.
     
     - **skip**: Number of records to skip (default: 0)
     - **limit**: Maximum number of records to return (default: 100)
+    - **after_id**: Cursor returned as `next_cursor` by the previous page
     
-    Returns a list of reports.
+    Returns a list of reports. Transcriptions, summaries and extracted
+    sections are left out; fetch a single report to get them.
     """
-    reports = await report_service.list_reports(db, skip, limit)
+    reports = await report_service.list_reports(db, skip, limit, after_id)
+    total = await report_service.count_reports(db)
     
-    return ReportListResponse(
-        reports=[ReportResponse.model_validate(r) for r in reports],
-        total=len(reports)
+    next_cursor = None
+    if reports and len(reports) == limit:
+        next_cursor = reports[-1].id
+    
+    # Rows come from our own schema: skip validation on the way in and
+    # serialize straight to JSON bytes on the way out
+    page = ReportListResponse.model_construct(
+        reports=[_build_list_item(r) for r in reports],
+        total=total,
+        next_cursor=next_cursor
     )
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -275,8 +407,9 @@ async def list_reports(
 )
 async def download_pdf(
     report_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db)
-) -> FileResponse:
+) -> Response:
     """
     Download a report as PDF.
     
@@ -284,23 +417,34 @@ async def download_pdf(
     
     Returns the PDF file.
     """
+    report = await report_service.get_report(db, report_id)
+    
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+    
+    version = report_service.export_version(report)
+    etag = _report_etag(report, version)
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=_cache_headers(etag)
+        )
+    
     try:
-        pdf_path = await report_service.generate_pdf_report(db, report_id)
-        
-        report = await report_service.get_report(db, report_id)
+        pdf_path = await report_service.render_pdf_report(report, version)
         filename = f"report_{report_id}_{report.original_filename}.pdf"
         
         return FileResponse(
             path=pdf_path,
             media_type="application/pdf",
-            filename=filename
+            filename=filename,
+            stat_result=await asyncio.to_thread(os.stat, pdf_path),
+            headers=_cache_headers(etag)
         )
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -314,8 +458,9 @@ async def download_pdf(
 )
 async def download_markdown(
     report_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db)
-) -> FileResponse:
+) -> Response:
     """
     Download a report as Markdown.
     
@@ -323,23 +468,34 @@ async def download_markdown(
     
     Returns the Markdown file.
     """
+    report = await report_service.get_report(db, report_id)
+    
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Report not found"
+        )
+    
+    version = report_service.export_version(report)
+    etag = _report_etag(report, version)
+    if _etag_matches(request, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=_cache_headers(etag)
+        )
+    
     try:
-        md_path = await report_service.generate_markdown_report(db, report_id)
-        
-        report = await report_service.get_report(db, report_id)
+        md_path = await report_service.render_markdown_report(report, version)
         filename = f"report_{report_id}_{report.original_filename}.md"
         
         return FileResponse(
             path=md_path,
             media_type="text/markdown",
-            filename=filename
+            filename=filename,
+            stat_result=await asyncio.to_thread(os.stat, md_path),
+            headers=_cache_headers(etag)
         )
     
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e)
-        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -369,14 +525,11 @@ async def delete_report(
             detail="Report not found"
         )
     
-    # Delete associated files
-    await file_handler.delete_file(report.file_path)
-    
-    # Delete PDF and MD if they exist
-    pdf_path = file_handler.get_report_path(report_id, "pdf")
-    md_path = file_handler.get_report_path(report_id, "md")
-    await file_handler.delete_file(pdf_path)
-    await file_handler.delete_file(md_path)
+    # Delete the audio file and the PDF/MD exports if they exist
+    await asyncio.gather(
+        file_handler.delete_file(report.file_path),
+        file_handler.delete_report_files(report_id)
+    )
     
     # Delete from database
     await db.delete(report)
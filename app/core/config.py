@@ -57,14 +57,27 @@ class Settings(BaseSettings):
     DB_PORT: str = os.getenv("DB_PORT", "")
     DB_NAME: str = os.getenv("DB_NAME", "db.sqlite3")
 
+    # Database connection pool (not used with SQLite)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "20"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+    # Background SELECT 1 keeping pooled connections warm (0 disables it)
+    DB_KEEPALIVE_INTERVAL: int = int(os.getenv("DB_KEEPALIVE_INTERVAL", "300"))  # seconds
+
     # OpenAI API
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    MIN_SUMMARY_WORDS: int = int(os.getenv("MIN_SUMMARY_WORDS", "30"))  # shorter transcriptions skip GPT
+    OPENAI_CONCURRENCY: int = int(os.getenv("OPENAI_CONCURRENCY", "4"))  # requests in flight per batch service
     
     # File Storage
     UPLOAD_DIR: str = os.getenv("UPLOAD_DIR", "uploads")
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50MB
     ALLOWED_AUDIO_EXTENSIONS: List[str] = [".mp3", ".wav", ".m4a", ".ogg", ".webm"]
 
+    # PDF rendering worker processes (0 means one per CPU)
+    PDF_WORKERS: int = int(os.getenv("PDF_WORKERS", "0"))
+
     @property
     def DATABASE_URL(self) -> str:
         """Construct database URL based on configuration."""
@@ -0,0 +1,15 @@
+"""
+Shared OpenAI client.
+"""
+
+from openai import AsyncOpenAI, Timeout
+
+from app.core.config import settings
+
+# One client (and connection pool) for all the OpenAI services. Whisper uploads
+# of long meetings can take minutes, hence the generous read timeout
+openai_client = AsyncOpenAI(
+    api_key=settings.OPENAI_API_KEY,
+    max_retries=2,
+    timeout=Timeout(300.0, connect=10.0)
+)
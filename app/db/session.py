@@ -2,9 +2,12 @@
 Database session management.
 """
 
+import asyncio
 import contextlib
 from typing import Any, AsyncGenerator, AsyncIterator
 
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
     AsyncSession,
@@ -15,12 +18,30 @@ from sqlalchemy.ext.asyncio import (
 from app.core.config import settings
 
 
+def _json_serializer(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
 class DatabaseSessionManager:
     def __init__(self, host: str, engine_kwargs: dict[str, Any] = {}):
+        engine_kwargs = dict(engine_kwargs)
+
         # Configuration pour SQLite async
         if "sqlite" in host:
             engine_kwargs["connect_args"] = {"check_same_thread": False}
-        
+        else:
+            # Sessions hold a connection only inside a transaction, the long
+            # OpenAI calls run between commits, so the pool is sized for
+            # concurrent requests rather than concurrent pipelines
+            engine_kwargs.setdefault("pool_size", settings.DB_POOL_SIZE)
+            engine_kwargs.setdefault("max_overflow", settings.DB_MAX_OVERFLOW)
+            engine_kwargs.setdefault("pool_recycle", settings.DB_POOL_RECYCLE)
+            engine_kwargs.setdefault("pool_pre_ping", settings.DB_POOL_PRE_PING)
+
+        # Encode/decode JSON columns with orjson
+        engine_kwargs.setdefault("json_serializer", _json_serializer)
+        engine_kwargs.setdefault("json_deserializer", orjson.loads)
+
         self._engine = create_async_engine(host, **engine_kwargs)
         self._sessionmaker = async_sessionmaker(
             autocommit=False,
@@ -48,6 +69,15 @@ class DatabaseSessionManager:
                 await connection.rollback()
                 raise
 
+    async def keepalive(self, interval: float) -> None:
+        """Run SELECT 1 every interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            # A failed ping is not fatal, the pool recycles broken connections
+            with contextlib.suppress(Exception):
+                async with self.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+
     @contextlib.asynccontextmanager
     async def session(self) -> AsyncIterator[AsyncSession]:
         if self._sessionmaker is None:
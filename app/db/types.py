@@ -0,0 +1,9 @@
+"""
+Custom column types.
+"""
+
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Native JSON column: JSONB on PostgreSQL, SQLAlchemy's JSON everywhere else
+JSONList = JSON().with_variant(JSONB(), "postgresql")
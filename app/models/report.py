@@ -5,10 +5,11 @@ Report model for storing meeting transcriptions and summaries.
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, DateTime, Integer, Float
+from sqlalchemy import String, Text, DateTime, Integer, Float, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
+from app.db.types import JSONList
 
 
 class Report(Base):
@@ -16,13 +17,14 @@ class Report(Base):
 
     __tablename__ = "reports"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     
     # File information
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)  # in bytes
     duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # in seconds
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)  # SHA-256 hex of the audio
     
     # Transcription
     transcription: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -30,9 +32,9 @@ class Report(Base):
     
     # Summary
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    topics: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
-    decisions: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
-    action_items: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
+    topics: Mapped[Optional[list]] = mapped_column(JSONList, nullable=True)
+    decisions: Mapped[Optional[list]] = mapped_column(JSONList, nullable=True)
+    action_items: Mapped[Optional[list]] = mapped_column(JSONList, nullable=True)
     
     # Status
     status: Mapped[str] = mapped_column(
@@ -45,16 +47,32 @@ class Report(Base):
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, 
+        DateTime(timezone=True), 
         nullable=False, 
-        default=datetime.utcnow
+        server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, 
+        DateTime(timezone=True), 
         nullable=False, 
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        server_default=func.now(),
+        onupdate=func.now()  # rendered as now() in the UPDATE statement
     )
 
+    # Fetch server-generated timestamps with RETURNING instead of expiring them
+    __mapper_args__ = {"eager_defaults": True}
+
     def __repr__(self) -> str:
         return f"<Report(id={self.id}, filename={self.original_filename}, status={self.status})>"
+
+
+# One report per audio content, repeated uploads reuse it
+Index("ix_reports_content_hash", Report.content_hash, unique=True)
+
+# Small partial index over reports that are still being processed
+_in_progress = text("status IN ('pending', 'transcribing', 'summarizing')")
+Index(
+    "ix_reports_status_pending",
+    Report.created_at,
+    postgresql_where=_in_progress,
+    sqlite_where=_in_progress,
+)
@@ -3,13 +3,15 @@ Pydantic schemas for report endpoints.
 """
 
 from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field
+from typing import Annotated, Any, Optional, List
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
 
 class TranscriptionSegment(BaseModel):
     """Schema for a transcription segment with speaker info."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     speaker: Optional[str] = None
     text: str
     start: Optional[float] = None
@@ -19,6 +21,8 @@ class TranscriptionSegment(BaseModel):
 class Topic(BaseModel):
     """Schema for a discussed topic."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     title: str
     description: Optional[str] = None
 
@@ -26,6 +30,8 @@ class Topic(BaseModel):
 class Decision(BaseModel):
     """Schema for a decision made during the meeting."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     description: str
     responsible: Optional[str] = None
 
@@ -33,12 +39,34 @@ class Decision(BaseModel):
 class ActionItem(BaseModel):
     """Schema for an action item from the meeting."""
     
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     task: str
     assignee: Optional[str] = None
     deadline: Optional[str] = None
     priority: Optional[str] = None
 
 
+def _entries_with(key: str) -> BeforeValidator:
+    """Keep only the dict entries that have key, anything but a list becomes []."""
+    def _filter(value: Any) -> Any:
+        if not isinstance(value, list):
+            return []
+        return [entry for entry in value if isinstance(entry, dict) and key in entry]
+    return BeforeValidator(_filter)
+
+
+class SummaryResult(BaseModel):
+    """Schema of the structured summary returned by the model."""
+    
+    model_config = ConfigDict(extra="ignore")
+    
+    summary: Optional[str] = ""
+    topics: Annotated[List[Topic], _entries_with("title")] = Field(default_factory=list)
+    decisions: Annotated[List[Decision], _entries_with("description")] = Field(default_factory=list)
+    action_items: Annotated[List[ActionItem], _entries_with("task")] = Field(default_factory=list)
+
+
 class ReportBase(BaseModel):
     """Base schema for report."""
     
@@ -50,6 +78,7 @@ class ReportCreate(ReportBase):
     """Schema for creating a report."""
     
     file_path: str
+    content_hash: Optional[str] = None
 
 
 class TranscriptionResponse(BaseModel):
@@ -90,69 +119,31 @@ class ReportResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-    
-    @classmethod
-    def model_validate(cls, obj):
-        """Custom validation to parse JSON strings from database."""
-        import json
-        
-        # If obj is a dict (already processed), return as is
-        if isinstance(obj, dict):
-            return super().model_validate(obj)
-        
-        # Parse JSON strings from database model
-        data = {
-            "id": obj.id,
-            "original_filename": obj.original_filename,
-            "file_size": obj.file_size,
-            "duration": obj.duration,
-            "transcription": obj.transcription,
-            "language": obj.language,
-            "summary": obj.summary,
-            "status": obj.status,
-            "error_message": obj.error_message,
-            "created_at": obj.created_at,
-            "updated_at": obj.updated_at,
-        }
-        
-        # Parse JSON fields
-        if obj.topics:
-            try:
-                topics_data = json.loads(obj.topics) if isinstance(obj.topics, str) else obj.topics
-                data["topics"] = [Topic(**t) for t in topics_data]
-            except:
-                data["topics"] = None
-        else:
-            data["topics"] = None
-        
-        if obj.decisions:
-            try:
-                decisions_data = json.loads(obj.decisions) if isinstance(obj.decisions, str) else obj.decisions
-                data["decisions"] = [Decision(**d) for d in decisions_data]
-            except:
-                data["decisions"] = None
-        else:
-            data["decisions"] = None
-        
-        if obj.action_items:
-            try:
-                action_items_data = json.loads(obj.action_items) if isinstance(obj.action_items, str) else obj.action_items
-                data["action_items"] = [ActionItem(**a) for a in action_items_data]
-            except:
-                data["action_items"] = None
-        else:
-            data["action_items"] = None
-        
-        return cls(**data)
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ReportListItemResponse(BaseModel):
+    """Schema for a report in a listing, without the heavy text fields."""
+    
+    id: int
+    original_filename: str
+    file_size: int
+    duration: Optional[float] = None
+    language: Optional[str] = None
+    status: str
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ReportListResponse(BaseModel):
     """Schema for list of reports."""
     
-    reports: List[ReportResponse]
+    reports: List[ReportListItemResponse]
     total: int
+    next_cursor: Optional[int] = None
 
 
 class GenerateReportRequest(BaseModel):
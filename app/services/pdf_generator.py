@@ -2,69 +2,96 @@
 PDF generation service for meeting reports.
 """
 
+import html
 import os
 from datetime import datetime
-from typing import Optional, List
+from pathlib import Path
+from typing import Any, Dict, Optional, List, Union
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.enums import TA_JUSTIFY, TA_LEFT, TA_CENTER
 
-from app.schemas.report import Topic, Decision, ActionItem
+
+def _build_styles() -> StyleSheet1:
+    """Build the sample stylesheet extended with the report styles."""
+    styles = getSampleStyleSheet()
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor='#1a1a1a',
+        spaceAfter=30,
+        alignment=TA_CENTER
+    ))
+    
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor='#2c3e50',
+        spaceAfter=12,
+        spaceBefore=12
+    ))
+    
+    # Subsection style
+    styles.add(ParagraphStyle(
+        name='SubSection',
+        parent=styles['Heading3'],
+        fontSize=14,
+        textColor='#34495e',
+        spaceAfter=8,
+        spaceBefore=8
+    ))
+    
+    # Transcription paragraph style, spaced without extra Spacer flowables
+    styles.add(ParagraphStyle(
+        name='Transcription',
+        parent=styles['Normal'],
+        spaceAfter=0.1 * inch
+    ))
+    
+    return styles
+
+
+# Styles are immutable once built, so every PDF shares the same instances
+_STYLES = _build_styles()
+
+# Page layout shared by all reports
+_DOC_OPTIONS = {
+    "pagesize": A4,
+    "rightMargin": 72,
+    "leftMargin": 72,
+    "topMargin": 72,
+    "bottomMargin": 18,
+}
+
+# Metadata labels
+_DATE_LABEL = "<b>Date:</b> "
+_DURATION_LABEL = "<b>Duration:</b> "
+_LANGUAGE_LABEL = "<b>Language:</b> "
 
 
 class PDFGeneratorService:
     """Service for generating PDF reports."""
 
-    def __init__(self):
-        """Initialize the PDF generator service."""
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles."""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor='#1a1a1a',
-            spaceAfter=30,
-            alignment=TA_CENTER
-        ))
-        
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor='#2c3e50',
-            spaceAfter=12,
-            spaceBefore=12
-        ))
-        
-        # Subsection style
-        self.styles.add(ParagraphStyle(
-            name='SubSection',
-            parent=self.styles['Heading3'],
-            fontSize=14,
-            textColor='#34495e',
-            spaceAfter=8,
-            spaceBefore=8
-        ))
+    styles = _STYLES
 
     def generate_pdf(
         self,
-        output_path: str,
+        output_path: Union[str, Path],
         title: str,
         transcription: Optional[str] = None,
         summary: Optional[str] = None,
-        topics: Optional[List[Topic]] = None,
-        decisions: Optional[List[Decision]] = None,
-        action_items: Optional[List[ActionItem]] = None,
+        topics: Optional[List[Dict[str, Any]]] = None,
+        decisions: Optional[List[Dict[str, Any]]] = None,
+        action_items: Optional[List[Dict[str, Any]]] = None,
         metadata: Optional[dict] = None
-    ) -> str:
+    ) -> Union[str, Path]:
         """
         Generate a PDF report.
         
@@ -73,9 +100,9 @@ class PDFGeneratorService:
             title: Report title
             transcription: Meeting transcription
             summary: Meeting summary
-            topics: List of topics discussed
-            decisions: List of decisions made
-            action_items: List of action items
+            topics: Topics discussed, as stored on the report (dicts)
+            decisions: Decisions made, as stored on the report (dicts)
+            action_items: Action items, as stored on the report (dicts)
             metadata: Additional metadata (date, duration, etc.)
         
         Returns:
@@ -83,14 +110,8 @@ class PDFGeneratorService:
         """
         try:
             # Create the PDF document
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
+            # ReportLab only accepts str filenames
+            doc = SimpleDocTemplate(os.fspath(output_path), **_DOC_OPTIONS)
             
             # Container for the 'Flowable' objects
             elements = []
@@ -142,18 +163,18 @@ class PDFGeneratorService:
         elements = []
         
         if metadata.get('date'):
-            date_text = f"<b>Date:</b> {metadata['date']}"
+            date_text = f"{_DATE_LABEL}{metadata['date']}"
             elements.append(Paragraph(date_text, self.styles['Normal']))
         
         if metadata.get('duration'):
             duration = metadata['duration']
             minutes = int(duration // 60)
             seconds = int(duration % 60)
-            duration_text = f"<b>Duration:</b> {minutes}m {seconds}s"
+            duration_text = f"{_DURATION_LABEL}{minutes}m {seconds}s"
             elements.append(Paragraph(duration_text, self.styles['Normal']))
         
         if metadata.get('language'):
-            lang_text = f"<b>Language:</b> {metadata['language']}"
+            lang_text = f"{_LANGUAGE_LABEL}{metadata['language']}"
             elements.append(Paragraph(lang_text, self.styles['Normal']))
         
         return elements
@@ -165,49 +186,49 @@ class PDFGeneratorService:
         elements.append(Paragraph(summary, self.styles['Normal']))
         return elements
 
-    def _add_topics_section(self, topics: List[Topic]) -> List:
+    def _add_topics_section(self, topics: List[Dict[str, Any]]) -> List:
         """Add topics section to the PDF."""
         elements = []
         elements.append(Paragraph("Topics Discussed", self.styles['SectionHeader']))
         
         for i, topic in enumerate(topics, 1):
-            topic_title = f"<b>{i}. {topic.title}</b>"
+            topic_title = f"<b>{i}. {topic['title']}</b>"
             elements.append(Paragraph(topic_title, self.styles['Normal']))
-            if topic.description:
-                elements.append(Paragraph(topic.description, self.styles['Normal']))
+            if topic.get('description'):
+                elements.append(Paragraph(topic['description'], self.styles['Normal']))
             elements.append(Spacer(1, 0.1 * inch))
         
         return elements
 
-    def _add_decisions_section(self, decisions: List[Decision]) -> List:
+    def _add_decisions_section(self, decisions: List[Dict[str, Any]]) -> List:
         """Add decisions section to the PDF."""
         elements = []
         elements.append(Paragraph("Decisions Made", self.styles['SectionHeader']))
         
         for i, decision in enumerate(decisions, 1):
-            decision_text = f"<b>{i}.</b> {decision.description}"
-            if decision.responsible:
-                decision_text += f" <i>(Responsible: {decision.responsible})</i>"
+            decision_text = f"<b>{i}.</b> {decision['description']}"
+            if decision.get('responsible'):
+                decision_text += f" <i>(Responsible: {decision['responsible']})</i>"
             elements.append(Paragraph(decision_text, self.styles['Normal']))
             elements.append(Spacer(1, 0.1 * inch))
         
         return elements
 
-    def _add_action_items_section(self, action_items: List[ActionItem]) -> List:
+    def _add_action_items_section(self, action_items: List[Dict[str, Any]]) -> List:
         """Add action items section to the PDF."""
         elements = []
         elements.append(Paragraph("Action Items", self.styles['SectionHeader']))
         
         for i, item in enumerate(action_items, 1):
-            item_text = f"<b>{i}.</b> {item.task}"
+            item_text = f"<b>{i}.</b> {item['task']}"
             
             details = []
-            if item.assignee:
-                details.append(f"Assignee: {item.assignee}")
-            if item.deadline:
-                details.append(f"Deadline: {item.deadline}")
-            if item.priority:
-                details.append(f"Priority: {item.priority}")
+            if item.get('assignee'):
+                details.append(f"Assignee: {item['assignee']}")
+            if item.get('deadline'):
+                details.append(f"Deadline: {item['deadline']}")
+            if item.get('priority'):
+                details.append(f"Priority: {item['priority']}")
             
             if details:
                 item_text += f" <i>({', '.join(details)})</i>"
@@ -223,12 +244,12 @@ class PDFGeneratorService:
         elements.append(Paragraph("Full Transcription", self.styles['SectionHeader']))
         elements.append(Spacer(1, 0.1 * inch))
         
-        # Split transcription into paragraphs
-        paragraphs = transcription.split('\n\n')
-        for para in paragraphs:
-            if para.strip():
-                elements.append(Paragraph(para.strip(), self.styles['Normal']))
-                elements.append(Spacer(1, 0.1 * inch))
+        # One paragraph per blank-line block keeps ReportLab's line breaking
+        # linear; the text is escaped, it is not ReportLab markup
+        for para in transcription.split('\n\n'):
+            body = html.escape(para.strip(), quote=False).replace('\n', '<br/>')
+            if body:
+                elements.append(Paragraph(body, self.styles['Transcription']))
         
         return elements
 
@@ -2,29 +2,105 @@
 Report service for managing report generation workflow.
 """
 
-import json
-from typing import Optional, List
-from datetime import datetime
-from sqlalchemy import select
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Any, AsyncGenerator, Callable, Dict, Optional, List, Sequence, Tuple
+import aiofiles
+import anyio
+import orjson
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
+from app.core.config import settings
 from app.models.report import Report
-from app.schemas.report import (
-    ReportCreate, 
-    ReportResponse, 
-    Topic, 
-    Decision, 
-    ActionItem
-)
+from app.schemas.report import ReportCreate, ReportResponse
 from app.services.transcription import transcription_service
 from app.services.summary import summary_service
 from app.services.pdf_generator import pdf_generator_service
 from app.utils.file_handler import file_handler
 
+# Workers are started from a forkserver (spawned where that's unavailable):
+# forking the multithreaded server process itself can deadlock the child
+_PDF_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _new_pdf_pool() -> ProcessPoolExecutor:
+    """Create the pool of PDF rendering worker processes."""
+    return ProcessPoolExecutor(
+        max_workers=settings.PDF_WORKERS or None,
+        mp_context=_PDF_MP_CONTEXT
+    )
+
+
+# PDF rendering is CPU-bound pure Python, run it in worker processes so it
+# neither blocks the event loop nor contends for the GIL
+pdf_pool = _new_pdf_pool()
+
+
+async def _run_in_pdf_pool(render: Callable[[], Any]) -> Any:
+    """
+    Run a render function in the PDF pool.
+    
+    A pool whose worker died (e.g. killed for running out of memory) is
+    broken for good: it is replaced and the render is retried once.
+    """
+    global pdf_pool
+    loop = asyncio.get_running_loop()
+    pool = pdf_pool
+    try:
+        return await loop.run_in_executor(pool, render)
+    except BrokenProcessPool:
+        # Concurrent renders all see the same broken pool, replace it once
+        if pdf_pool is pool:
+            pdf_pool = _new_pdf_pool()
+            pool.shutdown(wait=False)
+        return await loop.run_in_executor(pdf_pool, render)
+
+
+async def shutdown_pdf_pool() -> None:
+    """Stop the PDF workers, waiting for them off the event loop."""
+    await asyncio.to_thread(pdf_pool.shutdown)
+
 
 class ReportService:
     """Service for managing report generation workflow."""
 
+    def export_version(self, report: Report) -> str:
+        """
+        Fingerprint of everything the PDF and Markdown exports show.
+        
+        It changes exactly when an export would render differently, unlike
+        updated_at, which SQLite only stores to the second.
+        
+        Args:
+            report: Report to fingerprint
+        
+        Returns:
+            Hex digest of the exported fields
+        """
+        exported = orjson.dumps([
+            report.id,
+            report.original_filename,
+            report.created_at,
+            report.duration,
+            report.language,
+            report.transcription,
+            report.summary,
+            report.topics,
+            report.decisions,
+            report.action_items
+        ])
+        return hashlib.blake2b(exported, digest_size=16).hexdigest()
+
     async def create_report(
         self,
         db: AsyncSession,
@@ -33,6 +109,9 @@ class ReportService:
         """
         Create a new report in the database.
         
+        The row is inserted with RETURNING, so the ID and server-side
+        defaults come back in the same round-trip.
+        
         Args:
             db: Database session
             report_data: Report creation data
@@ -40,16 +119,13 @@ class ReportService:
         Returns:
             Created report
         """
-        report = Report(
-            original_filename=report_data.original_filename,
-            file_path=report_data.file_path,
-            file_size=report_data.file_size,
-            status="pending"
+        result = await db.execute(
+            insert(Report)
+            .values(**report_data.model_dump(), status="pending")
+            .returning(Report)
         )
-        
-        db.add(report)
+        report = result.scalar_one()
         await db.commit()
-        await db.refresh(report)
         
         return report
 
@@ -73,30 +149,179 @@ class ReportService:
         )
         return result.scalar_one_or_none()
 
+    async def get_report_by_hash(
+        self,
+        db: AsyncSession,
+        content_hash: str
+    ) -> Optional[Report]:
+        """
+        Get the report of an audio content.
+        
+        Args:
+            db: Database session
+            content_hash: SHA-256 hex digest of the audio file
+        
+        Returns:
+            Report if found, None otherwise
+        """
+        result = await db.execute(
+            select(Report).where(Report.content_hash == content_hash)
+        )
+        return result.scalar_one_or_none()
+
+    async def create_or_get_report(
+        self,
+        db: AsyncSession,
+        report_data: ReportCreate
+    ) -> Tuple[Report, bool]:
+        """
+        Create a report, unless one already exists for the same audio.
+        
+        Args:
+            db: Database session
+            report_data: Report creation data, with its content_hash
+        
+        Returns:
+            Tuple of (report, whether it was created)
+        """
+        content_hash = report_data.content_hash
+        if content_hash:
+            existing = await self.get_report_by_hash(db, content_hash)
+            if existing:
+                return existing, False
+        
+        try:
+            return await self.create_report(db, report_data), True
+        except IntegrityError:
+            # The same audio was uploaded concurrently, the other request won
+            await db.rollback()
+            if not content_hash:
+                raise
+            existing = await self.get_report_by_hash(db, content_hash)
+            if existing is None:
+                raise
+            return existing, False
+
     async def list_reports(
         self,
         db: AsyncSession,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Report]:
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> Sequence[Report]:
         """
-        List all reports.
+        List all reports, newest first.
+        
+        Only the columns shown in listings are loaded; the transcription,
+        summary and JSON sections stay deferred.
         
         Args:
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
+            after_id: Keyset cursor, only return reports older than this ID
         
         Returns:
             List of reports
         """
-        result = await db.execute(
+        query = (
             select(Report)
-            .order_by(Report.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            .options(load_only(
+                Report.id,
+                Report.original_filename,
+                Report.file_size,
+                Report.duration,
+                Report.language,
+                Report.status,
+                Report.error_message,
+                Report.created_at,
+                Report.updated_at
+            ))
+            .order_by(Report.id.desc())
         )
-        return list(result.scalars().all())
+        if after_id is not None:
+            query = query.where(Report.id < after_id)
+        
+        result = await db.execute(query.offset(skip).limit(limit))
+        return result.scalars().all()
+
+    async def count_reports(self, db: AsyncSession) -> int:
+        """
+        Count all reports.
+        
+        Args:
+            db: Database session
+        
+        Returns:
+            Total number of reports
+        """
+        result = await db.execute(select(func.count(Report.id)))
+        return result.scalar_one()
+
+    async def claim_report(
+        self,
+        db: AsyncSession,
+        report: Report,
+        status: str
+    ) -> bool:
+        """
+        Move a report to a new status, unless another request changed it first.
+        
+        The status is only updated if it still is the one loaded on the
+        report, in a single UPDATE, so of several concurrent requests
+        exactly one claims the report.
+        
+        Args:
+            db: Database session the report belongs to
+            report: Loaded report to claim
+            status: Status to move the report to
+        
+        Returns:
+            True if the report was claimed
+        """
+        result = await db.execute(
+            update(Report)
+            .where(Report.id == report.id, Report.status == report.status)
+            .values(status=status)
+            .returning(Report.id)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = result.scalar_one_or_none() is not None
+        await db.commit()
+        if not claimed:
+            await db.refresh(report)
+            return False
+        
+        report.status = status
+        return True
+
+    def _apply_transcription(
+        self,
+        report: Report,
+        transcription_result: Dict[str, Any],
+        summarize_next: bool = False
+    ) -> None:
+        """
+        Copy a transcription result onto a report.
+        
+        With summarize_next the report moves straight to "summarizing", so
+        the commit that stores the transcription also starts the next stage.
+        """
+        report.transcription = transcription_result["transcription"]
+        report.language = transcription_result.get("language")
+        report.duration = transcription_result.get("duration")
+        if summarize_next and report.transcription:
+            report.status = "summarizing"
+        else:
+            report.status = "transcribed"
+
+    def _apply_summary(self, report: Report, summary_result: Dict[str, Any]) -> None:
+        """Copy a summary result onto a report."""
+        report.summary = summary_result["summary"]
+        report.topics = [t.model_dump() for t in summary_result["topics"]]
+        report.decisions = [d.model_dump() for d in summary_result["decisions"]]
+        report.action_items = [a.model_dump() for a in summary_result["action_items"]]
+        report.status = "completed"
 
     async def transcribe_report(
         self,
@@ -120,6 +345,27 @@ class ReportService:
         if not report:
             raise ValueError("Report not found")
         
+        return await self._transcribe(db, report, language)
+
+    async def _transcribe(
+        self,
+        db: AsyncSession,
+        report: Report,
+        language: Optional[str] = None,
+        summarize_next: bool = False
+    ) -> Report:
+        """
+        Transcribe the audio file of an already loaded report.
+        
+        Args:
+            db: Database session the report belongs to
+            report: Report to transcribe
+            language: Optional language hint
+            summarize_next: Leave the report in "summarizing" for _summarize
+        
+        Returns:
+            Updated report with transcription
+        """
         try:
             # Update status
             report.status = "transcribing"
@@ -132,15 +378,14 @@ class ReportService:
             )
             
             # Update report
-            report.transcription = transcription_result["transcription"]
-            report.language = transcription_result.get("language")
-            report.duration = transcription_result.get("duration")
-            report.status = "transcribed"
-            report.updated_at = datetime.utcnow()
+            self._apply_transcription(report, transcription_result, summarize_next)
             
             await db.commit()
             await db.refresh(report)
             
+            # Drop rendered files, they no longer match the report
+            await file_handler.delete_report_files(report.id)
+            
             return report
         
         except Exception as e:
@@ -169,13 +414,27 @@ class ReportService:
         if not report:
             raise ValueError("Report not found")
         
+        return await self._summarize(db, report)
+
+    async def _summarize(self, db: AsyncSession, report: Report) -> Report:
+        """
+        Generate the summary of an already loaded report.
+        
+        Args:
+            db: Database session the report belongs to
+            report: Report to summarize
+        
+        Returns:
+            Updated report with summary
+        """
         if not report.transcription:
             raise ValueError("Report must be transcribed first")
         
         try:
-            # Update status
-            report.status = "summarizing"
-            await db.commit()
+            # Update status, unless the transcription commit already did
+            if report.status != "summarizing":
+                report.status = "summarizing"
+                await db.commit()
             
             # Generate summary
             summary_result = await summary_service.generate_summary(
@@ -183,16 +442,14 @@ class ReportService:
             )
             
             # Update report
-            report.summary = summary_result["summary"]
-            report.topics = json.dumps([t.model_dump() for t in summary_result["topics"]])
-            report.decisions = json.dumps([d.model_dump() for d in summary_result["decisions"]])
-            report.action_items = json.dumps([a.model_dump() for a in summary_result["action_items"]])
-            report.status = "completed"
-            report.updated_at = datetime.utcnow()
+            self._apply_summary(report, summary_result)
             
             await db.commit()
             await db.refresh(report)
             
+            # Drop rendered files, they no longer match the report
+            await file_handler.delete_report_files(report.id)
+            
             return report
         
         except Exception as e:
@@ -201,6 +458,67 @@ class ReportService:
             await db.commit()
             raise
 
+    async def stream_summary(
+        self,
+        db: AsyncSession,
+        report: Report
+    ) -> AsyncGenerator[str, None]:
+        """
+        Generate the summary of a loaded report, streaming the model output.
+        
+        The report is updated once the stream is complete, exactly as with
+        generate_summary. If the stream is abandoned, the report goes back
+        to "transcribed".
+        
+        Args:
+            db: Database session the report belongs to
+            report: Transcribed report to summarize
+        
+        Yields:
+            Chunks of the JSON summary as the model produces them
+        """
+        transcription = report.transcription
+        if not transcription:
+            raise ValueError("Report must be transcribed first")
+        
+        try:
+            # Update status
+            report.status = "summarizing"
+            await db.commit()
+            
+            # Relay the summary while collecting it
+            chunks = []
+            async for chunk in summary_service.stream_summary(transcription):
+                chunks.append(chunk)
+                yield chunk
+            summary_result = summary_service.parse_summary("".join(chunks))
+            
+            # Update report
+            self._apply_summary(report, summary_result)
+            
+            await db.commit()
+            await db.refresh(report)
+            
+            # Drop rendered files, they no longer match the report
+            await file_handler.delete_report_files(report.id)
+        
+        except Exception as e:
+            report.status = "failed"
+            report.error_message = str(e)
+            await db.commit()
+            raise
+        
+        except BaseException:
+            # The client went away (generator closed or request cancelled)
+            # before the summary was stored: the transcription is still
+            # there, so leave the report ready to be summarized again. The
+            # shield keeps a cancelled request from aborting the cleanup
+            with anyio.CancelScope(shield=True):
+                await db.rollback()
+                report.status = "transcribed"
+                await db.commit()
+            raise
+
     async def process_complete_report(
         self,
         db: AsyncSession,
@@ -220,20 +538,97 @@ class ReportService:
         Returns:
             Fully processed report
         """
-        # Transcribe
-        report = await self.transcribe_report(db, report_id, language)
+        # Load once, both steps work on the same instance
+        report = await self.get_report(db, report_id)
+        if not report:
+            raise ValueError("Report not found")
+        
+        # Transcribe, the same commit starts the summary stage
+        await self._transcribe(db, report, language, summarize_next=include_summary)
         
         # Generate summary if requested
         if include_summary:
-            report = await self.generate_summary(db, report_id)
+            await self._summarize(db, report)
         
         return report
 
+    async def process_reports_batch(
+        self,
+        db: AsyncSession,
+        report_ids: List[int],
+        language: Optional[str] = None,
+        include_summary: bool = True
+    ) -> List[Report]:
+        """
+        Process several reports: transcription + summary.
+        
+        The OpenAI calls of all reports run concurrently (bounded by
+        OPENAI_CONCURRENCY) while database writes stay sequential, since a
+        session cannot be used by several tasks at once. A failing report
+        is marked as failed without aborting the others.
+        
+        Args:
+            db: Database session
+            report_ids: IDs of the reports to process
+            language: Optional language hint
+            include_summary: Whether to generate summaries
+        
+        Returns:
+            Processed reports, in the order of report_ids (missing IDs are skipped)
+        """
+        result = await db.execute(select(Report).where(Report.id.in_(report_ids)))
+        by_id = {report.id: report for report in result.scalars()}
+        reports = [by_id[report_id] for report_id in report_ids if report_id in by_id]
+        
+        # Transcribe
+        for report in reports:
+            report.status = "transcribing"
+        await db.commit()
+        
+        transcription_results = await transcription_service.transcribe_batch(
+            [report.file_path for report in reports],
+            language=language
+        )
+        transcribed = []
+        for report, transcription_result in zip(reports, transcription_results):
+            if isinstance(transcription_result, BaseException):
+                report.status = "failed"
+                report.error_message = str(transcription_result)
+            else:
+                self._apply_transcription(report, transcription_result, include_summary)
+                transcribed.append(report)
+        await db.commit()
+        
+        # Generate summaries if requested
+        to_summarize = [
+            (report, report.transcription)
+            for report in transcribed
+            if report.status == "summarizing" and report.transcription
+        ]
+        if to_summarize:
+            summary_results = await summary_service.generate_summaries_batch(
+                [transcription for _, transcription in to_summarize]
+            )
+            for (report, _), summary_result in zip(to_summarize, summary_results):
+                if isinstance(summary_result, BaseException):
+                    report.status = "failed"
+                    report.error_message = str(summary_result)
+                else:
+                    self._apply_summary(report, summary_result)
+            await db.commit()
+        
+        # Drop rendered files, they no longer match the reports
+        await asyncio.gather(*(
+            file_handler.delete_report_files(report.id) for report in transcribed
+        ))
+        
+        return reports
+
     async def generate_pdf_report(
         self,
         db: AsyncSession,
         report_id: int
-    ) -> str:
+    ) -> Path:
         """
         Generate a PDF report.
         
@@ -249,41 +644,55 @@ class ReportService:
         if not report:
             raise ValueError("Report not found")
         
-        # Parse JSON fields
-        topics = None
-        if report.topics:
-            topics_data = json.loads(report.topics)
-            topics = [Topic(**t) for t in topics_data]
+        return await self.render_pdf_report(report, self.export_version(report))
+
+    async def render_pdf_report(self, report: Report, version: str) -> Path:
+        """
+        Render the PDF file of an already loaded report.
+        
+        The file is kept on disk and reused until the exported content
+        changes. It is rendered to a temporary file first, so a concurrent
+        download never sees a partial PDF.
         
-        decisions = None
-        if report.decisions:
-            decisions_data = json.loads(report.decisions)
-            decisions = [Decision(**d) for d in decisions_data]
+        Args:
+            report: Report to render
+            version: Export version of the report, from export_version
         
-        action_items = None
-        if report.action_items:
-            action_items_data = json.loads(report.action_items)
-            action_items = [ActionItem(**a) for a in action_items_data]
+        Returns:
+            Path to the generated PDF
+        """
+        pdf_path = file_handler.get_report_path(report.id, version, "pdf")
+        if file_handler.is_report_fresh(pdf_path):
+            return pdf_path
         
         # Generate PDF
-        pdf_path = file_handler.get_report_path(report_id, "pdf")
-        
         metadata = {
             "date": report.created_at.strftime("%Y-%m-%d %H:%M"),
             "duration": report.duration,
             "language": report.language
         }
         
-        pdf_generator_service.generate_pdf(
-            output_path=pdf_path,
+        tmp_path = file_handler.get_temp_path(pdf_path)
+        render = partial(
+            pdf_generator_service.generate_pdf,
+            output_path=tmp_path,
             title=f"Meeting Report - {report.original_filename}",
             transcription=report.transcription,
             summary=report.summary,
-            topics=topics,
-            decisions=decisions,
-            action_items=action_items,
+            topics=report.topics,
+            decisions=report.decisions,
+            action_items=report.action_items,
             metadata=metadata
         )
+        try:
+            await _run_in_pdf_pool(render)
+            await file_handler.replace_file(tmp_path, pdf_path)
+        except BaseException:
+            await file_handler.delete_file(tmp_path)
+            raise
+        
+        # Drop the renders of previous versions
+        await file_handler.delete_report_files(report.id, ("pdf",), keep=pdf_path)
         
         return pdf_path
 
@@ -291,7 +700,7 @@ class ReportService:
         self,
         db: AsyncSession,
         report_id: int
-    ) -> str:
+    ) -> Path:
         """
         Generate a Markdown report.
         
@@ -307,36 +716,49 @@ class ReportService:
         if not report:
             raise ValueError("Report not found")
         
-        # Parse JSON fields
-        topics = None
-        if report.topics:
-            topics_data = json.loads(report.topics)
-            topics = [Topic(**t) for t in topics_data]
+        return await self.render_markdown_report(report, self.export_version(report))
+
+    async def render_markdown_report(self, report: Report, version: str) -> Path:
+        """
+        Render the Markdown file of an already loaded report.
+        
+        The file is kept on disk and reused until the exported content
+        changes. It is written to a temporary file first, so a concurrent
+        download never sees a partial file.
         
-        decisions = None
-        if report.decisions:
-            decisions_data = json.loads(report.decisions)
-            decisions = [Decision(**d) for d in decisions_data]
+        Args:
+            report: Report to render
+            version: Export version of the report, from export_version
         
-        action_items = None
-        if report.action_items:
-            action_items_data = json.loads(report.action_items)
-            action_items = [ActionItem(**a) for a in action_items_data]
+        Returns:
+            Path to the generated Markdown file
+        """
+        md_path = file_handler.get_report_path(report.id, version, "md")
+        if file_handler.is_report_fresh(md_path):
+            return md_path
         
         # Generate Markdown
         md_content = file_handler.generate_markdown_report(
             title=f"Meeting Report - {report.original_filename}",
             summary=report.summary or "",
-            topics=topics,
-            decisions=decisions,
-            action_items=action_items,
+            topics=report.topics,
+            decisions=report.decisions,
+            action_items=report.action_items,
             transcription=report.transcription or ""
         )
         
         # Save to file
-        md_path = file_handler.get_report_path(report_id, "md")
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(md_content)
+        tmp_path = file_handler.get_temp_path(md_path)
+        try:
+            async with aiofiles.open(tmp_path, 'w', encoding='utf-8') as f:
+                await f.write(md_content)
+            await file_handler.replace_file(tmp_path, md_path)
+        except BaseException:
+            await file_handler.delete_file(tmp_path)
+            raise
+        
+        # Drop the renders of previous versions
+        await file_handler.delete_report_files(report.id, ("md",), keep=md_path)
         
         return md_path
 
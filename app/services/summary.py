@@ -2,104 +2,47 @@
 Summary generation service using OpenAI GPT.
 """
 
-import json
 import asyncio
-from typing import Dict, Any, List
-from openai import OpenAI  
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+import orjson
 
 from app.core.config import settings
-from app.schemas.report import Topic, Decision, ActionItem
+from app.core.openai_client import openai_client
+from app.schemas.report import SummaryResult
 
 
-class SummaryService:
-    """Service for generating meeting summaries using OpenAI GPT."""
-
-    def __init__(self):
-        """Initialize the summary service."""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-
-    async def generate_summary(self, transcription: str) -> Dict[str, Any]:
-        """
-        Generate a structured summary from a meeting transcription.
-        
-        Args:
-            transcription: The meeting transcription text
-        
-        Returns:
-            Dictionary containing summary, topics, decisions, and action items
-        """
-        try:
-            # Create the prompt for structured summary
-            prompt = self._create_summary_prompt(transcription)
-            
-            
-            loop = asyncio.get_event_loop()
-            
-            def _generate():
-                return self.client.chat.completions.create(
-                    model="gpt-4o-mini",  # Using gpt-4o-mini for cost efficiency
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert meeting analyst. Your task is to analyze meeting transcriptions and extract key information in a structured format."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.3,  # Lower temperature for more consistent output
-                    response_format={"type": "json_object"}
-                )
-            
-            response = await loop.run_in_executor(None, _generate)
-            
-            # Parse the response
-            content = response.choices[0].message.content
-            result = json.loads(content)
-            
-            # Validate and structure the response
-            return {
-                "summary": result.get("summary", ""),
-                "topics": self._parse_topics(result.get("topics", [])),
-                "decisions": self._parse_decisions(result.get("decisions", [])),
-                "action_items": self._parse_action_items(result.get("action_items", []))
-            }
-        
-        except Exception as e:
-            raise Exception(f"Summary generation failed: {str(e)}")
-
-    def _create_summary_prompt(self, transcription: str) -> str:
-        """Create the prompt for summary generation."""
-        return f"""Analyze the following meeting transcription and provide a structured summary in JSON format.
+# Static parts of the summary prompt, the transcription goes in between
+_PROMPT_HEAD = """Analyze the following meeting transcription and provide a structured summary in JSON format.
 
 Transcription:
-{transcription}
+"""
+
+_PROMPT_TAIL = """
 
 Please provide your analysis in the following JSON structure:
-{{
+{
     "summary": "A concise paragraph summarizing the main points of the meeting",
     "topics": [
-        {{
+        {
             "title": "Topic name",
             "description": "Brief description of what was discussed"
-        }}
+        }
     ],
     "decisions": [
-        {{
+        {
             "description": "What was decided",
             "responsible": "Who is responsible (if mentioned)"
-        }}
+        }
     ],
     "action_items": [
-        {{
+        {
             "task": "What needs to be done",
             "assignee": "Who should do it (if mentioned)",
             "deadline": "When it should be done (if mentioned)",
             "priority": "high/medium/low (if mentioned)"
-        }}
+        }
     ]
-}}
+}
 
 Instructions:
 - Be concise but comprehensive
@@ -109,40 +52,144 @@ Instructions:
 - Identify key topics discussed
 """
 
-    def _parse_topics(self, topics_data: List[Dict]) -> List[Topic]:
-        """Parse topics from response data."""
-        topics = []
-        for topic in topics_data:
-            if isinstance(topic, dict) and "title" in topic:
-                topics.append(Topic(
-                    title=topic["title"],
-                    description=topic.get("description")
-                ))
-        return topics
-
-    def _parse_decisions(self, decisions_data: List[Dict]) -> List[Decision]:
-        """Parse decisions from response data."""
-        decisions = []
-        for decision in decisions_data:
-            if isinstance(decision, dict) and "description" in decision:
-                decisions.append(Decision(
-                    description=decision["description"],
-                    responsible=decision.get("responsible")
-                ))
-        return decisions
-
-    def _parse_action_items(self, action_items_data: List[Dict]) -> List[ActionItem]:
-        """Parse action items from response data."""
-        action_items = []
-        for item in action_items_data:
-            if isinstance(item, dict) and "task" in item:
-                action_items.append(ActionItem(
-                    task=item["task"],
-                    assignee=item.get("assignee"),
-                    deadline=item.get("deadline"),
-                    priority=item.get("priority")
-                ))
-        return action_items
+
+class SummaryService:
+    """Service for generating meeting summaries using OpenAI GPT."""
+
+    def __init__(self):
+        """Initialize the summary service."""
+        self.client = openai_client
+        # Bounds the requests in flight across batches
+        self._semaphore = asyncio.Semaphore(settings.OPENAI_CONCURRENCY)
+
+    async def generate_summary(self, transcription: str) -> Dict[str, Any]:
+        """
+        Generate a structured summary from a meeting transcription.
+        
+        Transcriptions shorter than MIN_SUMMARY_WORDS are not worth a GPT
+        call, they are returned as their own summary.
+        
+        Args:
+            transcription: The meeting transcription text
+        
+        Returns:
+            Dictionary containing summary, topics, decisions, and action items
+        """
+        short_summary = self._short_summary(transcription)
+        if short_summary is not None:
+            return short_summary
+        
+        try:
+            response = await self.client.chat.completions.create(
+                **self._completion_options(transcription)
+            )
+            
+            # Parse the response
+            return self.parse_summary(response.choices[0].message.content)
+        
+        except Exception as e:
+            raise Exception(f"Summary generation failed: {str(e)}")
+
+    async def stream_summary(self, transcription: str) -> AsyncIterator[str]:
+        """
+        Stream the JSON summary of a meeting transcription as it is generated.
+        
+        Args:
+            transcription: The meeting transcription text
+        
+        Yields:
+            Chunks of the JSON document, to be joined and given to parse_summary
+        """
+        short_summary = self._short_summary(transcription)
+        if short_summary is not None:
+            yield orjson.dumps(short_summary).decode()
+            return
+        
+        try:
+            stream = await self.client.chat.completions.create(
+                **self._completion_options(transcription),
+                stream=True
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        
+        except Exception as e:
+            raise Exception(f"Summary generation failed: {str(e)}")
+
+    def parse_summary(self, content: str) -> Dict[str, Any]:
+        """
+        Parse and validate the JSON summary returned by the model.
+        
+        Args:
+            content: JSON document produced by the model
+        
+        Returns:
+            Dictionary containing summary, topics, decisions, and action items
+        """
+        # Decoded and validated in a single pydantic-core call, the fields
+        # keep their models
+        return dict(SummaryResult.model_validate_json(content))
+
+    def _short_summary(self, transcription: str) -> Optional[Dict[str, Any]]:
+        """Summary of a transcription too short for GPT, None if it is long enough."""
+        # maxsplit bounds the work on long transcriptions
+        words = transcription.split(maxsplit=settings.MIN_SUMMARY_WORDS)
+        if len(words) >= settings.MIN_SUMMARY_WORDS:
+            return None
+        return {
+            "summary": transcription.strip(),
+            "topics": [],
+            "decisions": [],
+            "action_items": []
+        }
+
+    def _completion_options(self, transcription: str) -> Dict[str, Any]:
+        """Chat completion arguments for summarizing a transcription."""
+        return {
+            "model": "gpt-4o-mini",  # Using gpt-4o-mini for cost efficiency
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an expert meeting analyst. Your task is to analyze meeting transcriptions and extract key information in a structured format."
+                },
+                {
+                    "role": "user",
+                    "content": self._create_summary_prompt(transcription)
+                }
+            ],
+            "temperature": 0.3,  # Lower temperature for more consistent output
+            "response_format": {"type": "json_object"}
+        }
+
+    async def generate_summaries_batch(
+        self,
+        transcriptions: List[str]
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Generate summaries for several transcriptions concurrently.
+        
+        At most OPENAI_CONCURRENCY requests are in flight at a time.
+        
+        Args:
+            transcriptions: The meeting transcription texts
+        
+        Returns:
+            One summary dictionary per transcription, in order, or the
+            exception raised for that transcription
+        """
+        async def _one(transcription: str) -> Dict[str, Any]:
+            async with self._semaphore:
+                return await self.generate_summary(transcription)
+        
+        return await asyncio.gather(
+            *(_one(transcription) for transcription in transcriptions),
+            return_exceptions=True
+        )
+
+    def _create_summary_prompt(self, transcription: str) -> str:
+        """Create the prompt for summary generation."""
+        return _PROMPT_HEAD + transcription + _PROMPT_TAIL
 
 
 # Create a singleton instance
@@ -2,12 +2,12 @@
 Transcription service using OpenAI Whisper API.
 """
 
-import os
-from typing import Optional, Dict, Any
-from openai import OpenAI  
 import asyncio
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
 
 from app.core.config import settings
+from app.core.openai_client import openai_client
 
 
 class TranscriptionService:
@@ -15,7 +15,9 @@ class TranscriptionService:
 
     def __init__(self):
         """Initialize the transcription service."""
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = openai_client
+        # Bounds the requests in flight across batches
+        self._semaphore = asyncio.Semaphore(settings.OPENAI_CONCURRENCY)
 
     async def transcribe_audio(
         self, 
@@ -33,29 +35,24 @@ class TranscriptionService:
             Dictionary containing transcription and metadata
         """
         try:
-            loop = asyncio.get_event_loop()
-            
-            def _transcribe():
-                with open(file_path, "rb") as audio_file:
-                    return self.client.audio.transcriptions.create(
-                        model="whisper-1",
-                        file=audio_file,
-                        response_format="verbose_json",
-                        language=language,
-                    )
-            
-            response = await loop.run_in_executor(None, _transcribe)
-            # Extract segments with speaker identification (basic)
-            segments = []
-            if hasattr(response, 'segments') and response.segments:
-                for segment in response.segments:
-                    segments.append({
-                        "text": getattr(segment, "text", ""),
-                        "start": getattr(segment, "start", None),
-                        "end": getattr(segment, "end", None),
-                        "speaker": None
-                    })
-            
+            # The async client reads path-like files without blocking the loop
+            response = await self.client.audio.transcriptions.create(
+                model="whisper-1",
+                file=Path(file_path),
+                response_format="verbose_json",
+                language=language,
+            )
+            # Extract segments with speaker identification (basic), in a
+            # single comprehension as long meetings return thousands of them
+            segments = [
+                {
+                    "text": getattr(segment, "text", ""),
+                    "start": getattr(segment, "start", None),
+                    "end": getattr(segment, "end", None),
+                    "speaker": None
+                }
+                for segment in getattr(response, "segments", None) or ()
+            ]
             
             return {
                 "transcription": response.text,
@@ -67,6 +64,33 @@ class TranscriptionService:
         except Exception as e:
             raise Exception(f"Transcription failed: {str(e)}")
 
+    async def transcribe_batch(
+        self,
+        file_paths: List[str],
+        language: Optional[str] = None
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Transcribe several audio files concurrently.
+        
+        At most OPENAI_CONCURRENCY requests are in flight at a time.
+        
+        Args:
+            file_paths: Paths to the audio files
+            language: Optional language code
+        
+        Returns:
+            One transcription dictionary per file, in order, or the
+            exception raised for that file
+        """
+        async def _one(file_path: str) -> Dict[str, Any]:
+            async with self._semaphore:
+                return await self.transcribe_audio(file_path, language)
+        
+        return await asyncio.gather(
+            *(_one(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+
     async def transcribe_with_speaker_diarization(
         self, 
         file_path: str,
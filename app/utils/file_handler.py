@@ -2,15 +2,66 @@
 File handling utilities for audio uploads and storage.
 """
 
+import asyncio
+import hashlib
 import os
 import uuid
-import aiofiles
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple, Union
 from fastapi import UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.config import settings
 
+# Size of the chunks read from uploads while streaming them to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Lowercased allowed extensions, for constant-time lookups
+_ALLOWED_EXTENSIONS = frozenset(ext.lower() for ext in settings.ALLOWED_AUDIO_EXTENSIONS)
+
+
+def _write_sync(path: Path, src_file: BinaryIO, max_size: int) -> Tuple[int, str]:
+    """
+    Copy a file object to disk with blocking IO, hashing it on the way.
+
+    Meant to run in the threadpool: plain buffered writes are cheaper than
+    dispatching every chunk through an async file wrapper.
+
+    Args:
+        path: Destination path
+        src_file: Source file object
+        max_size: Stop copying once more than this many bytes were read
+
+    Returns:
+        Tuple of (bytes read, SHA-256 hex digest of the bytes written); the
+        size exceeds max_size if the copy was aborted
+    """
+    size = 0
+    hasher = hashlib.sha256()
+    with open(path, "wb", buffering=UPLOAD_CHUNK_SIZE) as f:
+        while chunk := src_file.read(UPLOAD_CHUNK_SIZE):
+            size += len(chunk)
+            if size > max_size:
+                break
+            hasher.update(chunk)
+            f.write(chunk)
+    return size, hasher.hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _report_path(upload_dir: Path, report_id: int, version: str, format: str) -> Path:
+    """Build (and memoize) the path of a rendered report file."""
+    return upload_dir / "reports" / f"report_{report_id}-{version}.{format}"
+
+
+def _file_too_large() -> HTTPException:
+    """Build the error raised for uploads over MAX_UPLOAD_SIZE."""
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
+    )
+
 
 class FileHandler:
     """Handler for file upload and storage operations."""
@@ -38,26 +89,29 @@ class FileHandler:
         Returns:
             True if valid, False otherwise
         """
-        file_ext = Path(filename).suffix.lower()
-        return file_ext in settings.ALLOWED_AUDIO_EXTENSIONS
+        dot = filename.rfind(".")
+        return dot > 0 and filename[dot:].lower() in _ALLOWED_EXTENSIONS
 
     async def save_upload_file(
         self, 
         upload_file: UploadFile,
         subdirectory: str = "audio"
-    ) -> Tuple[str, str, int]:
+    ) -> Tuple[str, str, int, str]:
         """
         Save an uploaded file to disk.
         
+        The content is hashed while it is copied, so duplicates can be
+        detected without reading the file again.
+        
         Args:
             upload_file: The uploaded file
             subdirectory: Subdirectory within upload dir (audio/reports)
         
         Returns:
-            Tuple of (file_path, original_filename, file_size)
+            Tuple of (file_path, original_filename, file_size, content_hash)
         
         Raises:
-            HTTPException: If file validation fails
+            HTTPException: If file validation fails (413 if it is too large)
         """
         # Validate file
         if not upload_file.filename:
@@ -74,24 +128,24 @@ class FileHandler:
         unique_filename = f"{uuid.uuid4()}{file_ext}"
         file_path = self.upload_dir / subdirectory / unique_filename
         
-        # Read file content
-        content = await upload_file.read()
-        file_size = len(content)
+        # The multipart parser already knows the size of the part
+        if upload_file.size is not None and upload_file.size > settings.MAX_UPLOAD_SIZE:
+            raise _file_too_large()
         
-        # Validate file size
+        # Stream file content to disk chunk by chunk
+        await upload_file.seek(0)
+        file_size, content_hash = await run_in_threadpool(
+            _write_sync, file_path, upload_file.file, settings.MAX_UPLOAD_SIZE
+        )
+
+        # Drop the partial file of an oversize upload
         if file_size > settings.MAX_UPLOAD_SIZE:
-            raise HTTPException(
-                status_code=400,
-                detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / (1024*1024)}MB"
-            )
-        
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
-        
-        return str(file_path), upload_file.filename, file_size
+            file_path.unlink(missing_ok=True)
+            raise _file_too_large()
+
+        return str(file_path), upload_file.filename, file_size, content_hash
 
-    async def delete_file(self, file_path: str) -> bool:
+    async def delete_file(self, file_path: Union[str, Path]) -> bool:
         """
         Delete a file from disk.
         
@@ -102,35 +156,111 @@ class FileHandler:
             True if deleted successfully, False otherwise
         """
         try:
-            path = Path(file_path)
-            if path.exists():
-                path.unlink()
-                return True
+            await run_in_threadpool(os.unlink, file_path)
+            return True
+        except FileNotFoundError:
             return False
         except Exception:
             return False
 
-    def get_report_path(self, report_id: int, format: str = "pdf") -> str:
+    def get_report_path(self, report_id: int, version: str, format: str = "pdf") -> Path:
         """
         Generate a path for a report file.
         
         Args:
             report_id: ID of the report
+            version: Fingerprint of the rendered report content
             format: Format of the report (pdf/md)
         
         Returns:
             Path to the report file
         """
-        filename = f"report_{report_id}.{format}"
-        return str(self.upload_dir / "reports" / filename)
+        return _report_path(self.upload_dir, report_id, version, format)
+
+    def is_report_fresh(self, report_path: Path) -> bool:
+        """
+        Check if a report file was already rendered.
+        
+        Paths include the version of the report content, so an existing
+        file always matches the current data.
+        
+        Args:
+            report_path: Path from get_report_path
+        
+        Returns:
+            True if the file exists
+        """
+        return report_path.is_file()
+
+    def get_temp_path(self, report_path: Path) -> Path:
+        """
+        Generate a unique temporary path to render a report file into.
+        
+        The file lives in the same directory as the report, so it can be
+        moved into place atomically, and it is hidden from the report globs.
+        
+        Args:
+            report_path: Path from get_report_path
+        
+        Returns:
+            Path to the temporary file
+        """
+        return report_path.with_name(f".{report_path.name}.{uuid.uuid4().hex}.tmp")
+
+    async def replace_file(self, src_path: Path, dst_path: Path) -> None:
+        """
+        Atomically move a file over another one.
+        
+        Readers of dst_path see either the previous file or the complete new
+        one, never a partial write.
+        
+        Args:
+            src_path: File to move
+            dst_path: Destination path
+        """
+        await run_in_threadpool(os.replace, src_path, dst_path)
+
+    def _list_report_files(self, report_id: int, formats: Sequence[str]) -> List[Path]:
+        """
+        List the rendered files of a report, all versions included.
+        
+        Files from before exports were versioned (report_{id}.{format}) are
+        listed too, so they get cleaned up.
+        """
+        reports_dir = self.upload_dir / "reports"
+        return [
+            path
+            for format in formats
+            for pattern in (f"report_{report_id}-*.{format}", f"report_{report_id}.{format}")
+            for path in reports_dir.glob(pattern)
+        ]
+
+    async def delete_report_files(
+        self,
+        report_id: int,
+        formats: Sequence[str] = ("pdf", "md"),
+        keep: Optional[Path] = None
+    ) -> None:
+        """
+        Delete the rendered PDF and Markdown files of a report.
+        
+        Args:
+            report_id: ID of the report
+            formats: Formats of the files to delete
+            keep: File to leave in place, e.g. the current version
+        """
+        paths = await run_in_threadpool(self._list_report_files, report_id, formats)
+        await asyncio.gather(*(
+            self.delete_file(path) for path in paths if path != keep
+        ))
 
     def generate_markdown_report(
         self,
         title: str,
         summary: str = "",
-        topics: list = None,
-        decisions: list = None,
-        action_items: list = None,
+        topics: Optional[List[Dict[str, Any]]] = None,
+        decisions: Optional[List[Dict[str, Any]]] = None,
+        action_items: Optional[List[Dict[str, Any]]] = None,
         transcription: str = ""
     ) -> str:
         """
@@ -139,63 +269,63 @@ class FileHandler:
         Args:
             title: Report title
             summary: Meeting summary
-            topics: List of topics
-            decisions: List of decisions
-            action_items: List of action items
+            topics: Topics, as stored on the report (dicts)
+            decisions: Decisions, as stored on the report (dicts)
+            action_items: Action items, as stored on the report (dicts)
             transcription: Full transcription
         
         Returns:
             Markdown formatted string
         """
-        md_content = f"# {title}\n\n"
+        parts = [f"# {title}\n\n"]
         
         # Summary section
         if summary:
-            md_content += "## Executive Summary\n\n"
-            md_content += f"{summary}\n\n"
+            parts.append("## Executive Summary\n\n")
+            parts.append(f"{summary}\n\n")
         
         # Topics section
         if topics:
-            md_content += "## Topics Discussed\n\n"
+            parts.append("## Topics Discussed\n\n")
             for i, topic in enumerate(topics, 1):
-                md_content += f"{i}. **{topic.title}**\n"
-                if topic.description:
-                    md_content += f"   {topic.description}\n"
-                md_content += "\n"
+                parts.append(f"{i}. **{topic['title']}**\n")
+                if topic.get("description"):
+                    parts.append(f"   {topic['description']}\n")
+                parts.append("\n")
         
         # Decisions section
         if decisions:
-            md_content += "## Decisions Made\n\n"
+            parts.append("## Decisions Made\n\n")
             for i, decision in enumerate(decisions, 1):
-                md_content += f"{i}. {decision.description}"
-                if decision.responsible:
-                    md_content += f" *(Responsible: {decision.responsible})*"
-                md_content += "\n"
-            md_content += "\n"
+                parts.append(f"{i}. {decision['description']}")
+                if decision.get("responsible"):
+                    parts.append(f" *(Responsible: {decision['responsible']})*")
+                parts.append("\n")
+            parts.append("\n")
         
         # Action items section
         if action_items:
-            md_content += "## Action Items\n\n"
+            parts.append("## Action Items\n\n")
             for i, item in enumerate(action_items, 1):
-                md_content += f"{i}. {item.task}"
+                parts.append(f"{i}. {item['task']}")
                 details = []
-                if item.assignee:
-                    details.append(f"Assignee: {item.assignee}")
-                if item.deadline:
-                    details.append(f"Deadline: {item.deadline}")
-                if item.priority:
-                    details.append(f"Priority: {item.priority}")
+                if item.get("assignee"):
+                    details.append(f"Assignee: {item['assignee']}")
+                if item.get("deadline"):
+                    details.append(f"Deadline: {item['deadline']}")
+                if item.get("priority"):
+                    details.append(f"Priority: {item['priority']}")
                 if details:
-                    md_content += f" *({', '.join(details)})*"
-                md_content += "\n"
-            md_content += "\n"
+                    parts.append(f" *({', '.join(details)})*")
+                parts.append("\n")
+            parts.append("\n")
         
         # Transcription section
         if transcription:
-            md_content += "## Full Transcription\n\n"
-            md_content += f"{transcription}\n"
+            parts.append("## Full Transcription\n\n")
+            parts.append(f"{transcription}\n")
         
-        return md_content
+        return "".join(parts)
 
 
 # Create a singleton instance
@@ -2,6 +2,8 @@
 FastAPI application main entry point.
 """
 
+import asyncio
+import contextlib
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,8 +12,10 @@ from app.api.auth import router as auth_router
 from app.api.health import router as health_router
 from app.api.reports import router as reports_router
 from app.core.config import settings
+from app.core.openai_client import openai_client
 from typing import AsyncGenerator
 from app.db.session import sessionmanager
+from app.services.report import shutdown_pdf_pool
 from contextlib import asynccontextmanager
 import bcrypt
 
@@ -26,7 +30,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Function that handles startup and shutdown events.
     To understand more, read https://fastapi.tiangolo.com/advanced/events/
     """
+    keepalive = None
+    if settings.DB_ENGINE != "sqlite" and settings.DB_KEEPALIVE_INTERVAL > 0:
+        keepalive = asyncio.create_task(
+            sessionmanager.keepalive(settings.DB_KEEPALIVE_INTERVAL)
+        )
     yield
+    if keepalive is not None:
+        # Let an in-flight SELECT 1 unwind before the engine is disposed
+        keepalive.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await keepalive
+    await shutdown_pdf_pool()
+    await openai_client.close()
     if sessionmanager._engine is not None:
         # Close the DB connection
         await sessionmanager.close()
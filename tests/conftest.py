@@ -1,7 +1,18 @@
-from typing import AsyncGenerator
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncGenerator, AsyncIterator, Generator
+from unittest.mock import AsyncMock
 
+import pytest
 import pytest_asyncio
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from openai.types.audio import TranscriptionVerbose
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
 from app.db.base import Base
@@ -11,10 +22,24 @@ from app.db.session import AsyncSession, DatabaseSessionManager, get_db
 
 # DONT REMOVE
 from app.models.user import APIToken, User
-from main import app
+from app.utils.file_handler import file_handler
 
-TEST_DATABASE_URL = settings.TEST_DATABASE_URL
-test_db = DatabaseSessionManager(TEST_DATABASE_URL)
+if settings.DB_ENGINE == "sqlite":
+    # One in-memory database, kept alive by a single shared connection
+    TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+    test_db = DatabaseSessionManager(TEST_DATABASE_URL, {"poolclass": StaticPool})
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with the driver
+    @event.listens_for(test_db._engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(test_db._engine.sync_engine, "begin")
+    def _begin(conn):
+        conn.exec_driver_sql("BEGIN")
+else:
+    TEST_DATABASE_URL = settings.TEST_DATABASE_URL
+    test_db = DatabaseSessionManager(TEST_DATABASE_URL)
 
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
@@ -26,25 +51,147 @@ async def prepare_test_db() -> AsyncGenerator[None, None]:
         await conn.run_sync(Base.metadata.drop_all)
 
 
-async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with test_db.session() as session:
-        yield session
-
-
-# Inject override into app
-app.dependency_overrides[get_db] = override_get_db
-
-
-@pytest_asyncio.fixture
-async def async_client() -> AsyncGenerator[AsyncClient, None]:
+# Canned OpenAI output, long enough to go past MIN_SUMMARY_WORDS
+MOCK_TRANSCRIPTION = (
+    "Good morning everyone. Today we reviewed the quarterly roadmap and the "
+    "hiring plan. Alice will send the updated budget to finance by Friday, "
+    "and we agreed to move the product launch to the first week of June "
+    "so that the mobile team has time to finish testing."
+)
+# Size of the content deltas of streamed completions
+MOCK_CHUNK_SIZE = 64
+MOCK_SUMMARY = {
+    "summary": "The team reviewed the roadmap and moved the launch to June.",
+    "topics": [{"title": "Quarterly roadmap", "description": "Review of the plan"}],
+    "decisions": [{"description": "Move the launch to June", "responsible": "Bob"}],
+    "action_items": [
+        {"task": "Send the updated budget", "assignee": "Alice",
+         "deadline": "Friday", "priority": "high"}
+    ],
+}
+
+
+def _completion(**kwargs: Any) -> Any:
+    """Canned chat completion, as chunks when called with stream=True."""
+    content = json.dumps(MOCK_SUMMARY)
+    if not kwargs.get("stream"):
+        return ChatCompletion.model_validate({
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }],
+        })
+
+    async def chunks() -> AsyncIterator[ChatCompletionChunk]:
+        for start in range(0, len(content), MOCK_CHUNK_SIZE):
+            yield ChatCompletionChunk.model_validate({
+                "id": "chatcmpl-test",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [{
+                    "index": 0,
+                    "delta": {"content": content[start:start + MOCK_CHUNK_SIZE]},
+                }],
+            })
+
+    return chunks()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_openai() -> Generator[SimpleNamespace, None, None]:
+    """
+    Replace the OpenAI endpoints used by the services with canned responses.
+
+    Autouse, so no test can reach the network. Yields the transcription and
+    chat completion mocks for tests that want to inspect the calls.
+    """
+    transcribe = AsyncMock(return_value=TranscriptionVerbose(
+        text=MOCK_TRANSCRIPTION, language="en", duration=60.0
+    ))
+    complete = AsyncMock(side_effect=_completion)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "openai.resources.audio.transcriptions.AsyncTranscriptions.create", transcribe
+        )
+        mp.setattr("openai.resources.chat.completions.AsyncCompletions.create", complete)
+        yield SimpleNamespace(transcribe=transcribe, complete=complete)
+
+
+@pytest.fixture(autouse=True)
+def upload_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """
+    Point the file handler at a per-test upload directory.
+
+    Autouse, so no test writes to or deletes from the real UPLOAD_DIR.
+    """
+    monkeypatch.setattr(file_handler, "upload_dir", tmp_path)
+    file_handler.ensure_upload_dir()
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """The application under test, imported on first use."""
+    from main import app as _app
+
+    return _app
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def db_connection(app: FastAPI) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Run each test inside a transaction that is rolled back afterwards.
+
+    Sessions handed to the app and to tests join it through savepoints, so
+    their commits are real for the test and gone for the next one.
+    """
+    async with test_db._engine.connect() as connection:
+        transaction = await connection.begin()
+
+        async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+            async with _test_session(connection) as session:
+                yield session
+
+        # Inject override into app
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            yield connection
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            await transaction.rollback()
+
+
+def _test_session(connection: AsyncConnection) -> AsyncSession:
+    return AsyncSession(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False
+    )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """
+    One client (and connection pool) shared by the whole test session.
+
+    ASGITransport does not send lifespan events, so the app's startup and
+    shutdown are run here, once, around the client.
+    """
     transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            yield client
 
 
 @pytest_asyncio.fixture
-async def session() -> AsyncGenerator[AsyncSession, None]:
-    async with test_db.session() as session:
+async def session(db_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
+    async with _test_session(db_connection) as session:
         yield session
 
 
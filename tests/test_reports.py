@@ -2,53 +2,617 @@
 Tests for report endpoints.
 """
 
+import base64
+import hashlib
+import json
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import anyio
 import pytest
-from fastapi import status
-from httpx import ASGITransport, AsyncClient
-from main import app
+from fastapi import HTTPException, status
+from httpx import AsyncClient
+from sqlalchemy import update
+from app.api.reports import get_report, list_reports, stream_summary
+from app.core.config import settings
+from app.db.session import AsyncSession
+from app.models.report import Report
+from app.schemas.report import ReportListResponse
+from app.services import report as report_module
+from app.services.report import report_service
+from app.services.summary import summary_service
+from app.utils.file_handler import file_handler
 
 
-@pytest.mark.asyncio
-async def test_health_check():
-    """Test the health check endpoint."""
-    
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.get("/health")
-        assert response.status_code == status.HTTP_200_OK
-        assert response.json()["status"] == "healthy"
+# A text file, which the upload endpoint must reject
+_INVALID_FILE = ("test.txt", b"test content", "text/plain")
+_INVALID_FILES = {"file": _INVALID_FILE}
+
+
+async def _add_report(session: AsyncSession, **values: Any) -> Report:
+    """Insert a report directly, with placeholder file information."""
+    report = Report(
+        **{
+            "original_filename": "meeting.mp3",
+            "file_path": "/nonexistent/meeting.mp3",
+            "file_size": 64,
+            **values,
+        }
+    )
+    session.add(report)
+    await session.commit()
+    return report
+
+
+def _sse_events(body: str) -> List[Tuple[str, str]]:
+    """Split a Server-Sent Events body into (event, data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields: Dict[str, List[str]] = {}
+        for line in block.splitlines():
+            name, _, value = line.partition(":")
+            fields.setdefault(name, []).append(value.removeprefix(" "))
+        events.append(("".join(fields.get("event", [])), "\n".join(fields.get("data", []))))
+    return events
+
+
+# (method, url, files, expected status, (JSON key, text expected in its value))
+CASES = [
+    ("GET", "/health", None, status.HTTP_200_OK, ("status", "healthy")),
+    (
+        "POST",
+        "/reports/upload",
+        _INVALID_FILES,
+        status.HTTP_400_BAD_REQUEST,
+        ("detail", "Invalid file format"),
+    ),
+]
 
 
 @pytest.mark.asyncio
-async def test_upload_invalid_file_type():
-    """Test uploading an invalid file type."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        # Try to upload a text file (not allowed)
-        files = {"file": ("test.txt", b"test content", "text/plain")}
-        response = await client.post("/reports/upload", files=files)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "Invalid file format" in response.json()["detail"]
+@pytest.mark.parametrize(
+    "method,url,files,status_code,check",
+    CASES,
+    ids=["health", "upload-invalid-type"],
+)
+async def test_endpoint_responses(
+    async_client: AsyncClient, method, url, files, status_code, check
+) -> None:
+    """Test the status code and a key of the JSON body of simple endpoints."""
+    response = await async_client.request(method, url, files=files)
+
+    assert response.status_code == status_code
+    key, expected = check
+    data = response.json()
+    assert expected.lower() in data[key].lower()
+
+
+@pytest.mark.parametrize(
+    "filename,valid",
+    [
+        ("meeting.mp3", True),
+        ("meeting.WAV", True),
+        ("team.sync.m4a", True),
+        ("test.txt", False),
+        ("meeting.mp3.exe", False),
+        (".mp3", False),
+        ("meeting", False),
+    ],
+)
+def test_validate_audio_file(filename: str, valid: bool) -> None:
+    """Test the upload extension check without going through HTTP."""
+    assert file_handler.validate_audio_file(filename) is valid
 
 
 @pytest.mark.asyncio
-async def test_get_nonexistent_report():
+async def test_get_nonexistent_report(session: AsyncSession) -> None:
     """Test getting a report that doesn't exist."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.get("/reports/99999")
-        
+    with pytest.raises(HTTPException) as exc:
+        await get_report(99999, db=session)
+
+    assert exc.value.status_code == status.HTTP_404_NOT_FOUND
+    assert "not found" in exc.value.detail.lower()
+
+
+@pytest.mark.asyncio
+async def test_list_reports(session: AsyncSession) -> None:
+    """Test the pagination of the report list."""
+    ids = [(await _add_report(session)).id for _ in range(3)]
+
+    response = await list_reports(skip=0, limit=2, after_id=None, db=session)
+    page = ReportListResponse.model_validate_json(response.body)
+
+    assert page.total == 3
+    assert [r.id for r in page.reports] == ids[:0:-1]
+    assert page.next_cursor == page.reports[-1].id
+
+    response = await list_reports(skip=0, limit=2, after_id=page.next_cursor, db=session)
+    page = ReportListResponse.model_validate_json(response.body)
+
+    assert page.total == 3
+    assert [r.id for r in page.reports] == ids[:1]
+    assert page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_list_reports_keyset(session: AsyncSession) -> None:
+    """Test counting reports and listing them after a cursor."""
+    ids = [(await _add_report(session)).id for _ in range(4)]
+
+    assert await report_service.count_reports(session) == 4
+
+    reports = await report_service.list_reports(session, after_id=ids[2])
+    assert [r.id for r in reports] == [ids[1], ids[0]]
+
+    reports = await report_service.list_reports(session, skip=1, after_id=ids[2])
+    assert [r.id for r in reports] == [ids[0]]
+
+    assert await report_service.list_reports(session, after_id=ids[0]) == []
+
+
+@pytest.mark.asyncio
+async def test_list_reports_cursor_params(
+    async_client: AsyncClient, session: AsyncSession
+) -> None:
+    """Test that the list endpoint pages with the limit and after_id parameters."""
+    ids = [(await _add_report(session)).id for _ in range(2)]
+
+    response = await async_client.get("/reports/", params={"limit": 1})
+    data = response.json()
+    assert [r["id"] for r in data["reports"]] == [ids[1]]
+    assert data["total"] == 2
+    assert data["next_cursor"] == ids[1]
+
+    response = await async_client.get(
+        "/reports/", params={"limit": 1, "after_id": data["next_cursor"]}
+    )
+    data = response.json()
+    assert [r["id"] for r in data["reports"]] == [ids[0]]
+    assert data["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_file_too_large(
+    monkeypatch, upload_dir, async_client: AsyncClient
+) -> None:
+    """Test that oversized uploads are rejected and not left on disk."""
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE", 8)
+
+    files = {"file": ("meeting.mp3", b"0123456789", "audio/mpeg")}
+    response = await async_client.post("/reports/upload", files=files)
+
+    assert response.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+    assert "File too large" in response.json()["detail"]
+    assert list((upload_dir / "audio").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_same_audio_twice(upload_dir, async_client: AsyncClient) -> None:
+    """Test that re-uploading the same audio returns the existing report."""
+    content = os.urandom(64)
+
+    first = await async_client.post(
+        "/reports/upload", files={"file": ("meeting.mp3", content, "audio/mpeg")}
+    )
+    second = await async_client.post(
+        "/reports/upload", files={"file": ("copy.mp3", content, "audio/mpeg")}
+    )
+
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_200_OK
+    assert second.json()["id"] == first.json()["id"]
+    assert len(list((upload_dir / "audio").iterdir())) == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_duplicate_in_progress(
+    upload_dir, async_client: AsyncClient, session: AsyncSession, mock_openai
+) -> None:
+    """Test that a duplicate of a report being processed does not restart it."""
+    content = os.urandom(64)
+    report = await _add_report(
+        session, content_hash=hashlib.sha256(content).hexdigest(), status="summarizing"
+    )
+    transcriptions = mock_openai.transcribe.await_count
+    completions = mock_openai.complete.await_count
+
+    response = await async_client.post(
+        "/reports/generate", files={"file": ("meeting.mp3", content, "audio/mpeg")}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["id"] == report.id
+    assert data["status"] == "summarizing"
+    assert mock_openai.transcribe.await_count == transcriptions
+    assert mock_openai.complete.await_count == completions
+    assert list((upload_dir / "audio").iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_generate_duplicate_transcribed(
+    async_client: AsyncClient, session: AsyncSession, mock_openai
+) -> None:
+    """Test that a duplicate of a transcribed report is only summarized."""
+    content = os.urandom(64)
+    report = await _add_report(
+        session,
+        content_hash=hashlib.sha256(content).hexdigest(),
+        transcription=mock_openai.transcribe.return_value.text,
+        status="transcribed",
+    )
+    transcriptions = mock_openai.transcribe.await_count
+    completions = mock_openai.complete.await_count
+
+    response = await async_client.post(
+        "/reports/generate", files={"file": ("meeting.mp3", content, "audio/mpeg")}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["id"] == report.id
+    assert data["status"] == "completed"
+    assert data["topics"][0]["title"] == "Quarterly roadmap"
+    assert mock_openai.transcribe.await_count == transcriptions
+    assert mock_openai.complete.await_count == completions + 1
+
+
+@pytest.mark.asyncio
+async def test_claim_report(session: AsyncSession) -> None:
+    """Test that a report is only claimed from the status it was loaded with."""
+    report = await _add_report(session)
+
+    assert await report_service.claim_report(session, report, "transcribing")
+    assert report.status == "transcribing"
+
+    # Another request moved the report on since it was loaded
+    await session.execute(
+        update(Report)
+        .where(Report.id == report.id)
+        .values(status="summarizing")
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+    assert not await report_service.claim_report(session, report, "transcribing")
+    assert report.status == "summarizing"
+
+
+@pytest.mark.asyncio
+async def test_generate_duplicate_pending(
+    async_client: AsyncClient, session: AsyncSession, mock_openai
+) -> None:
+    """Test that a duplicate of a report nobody processed runs the whole pipeline."""
+    content = os.urandom(64)
+    report = await _add_report(session, content_hash=hashlib.sha256(content).hexdigest())
+    transcriptions = mock_openai.transcribe.await_count
+
+    response = await async_client.post(
+        "/reports/generate", files={"file": ("meeting.mp3", content, "audio/mpeg")}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["id"] == report.id
+    assert data["status"] == "completed"
+    assert mock_openai.transcribe.await_count == transcriptions + 1
+
+
+@pytest.mark.asyncio
+async def test_download_nonexistent_report(async_client: AsyncClient) -> None:
+    """Test downloading a report that doesn't exist."""
+    for fmt in ("pdf", "markdown"):
+        response = await async_client.get(f"/reports/99999/download/{fmt}")
+
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert "not found" in response.json()["detail"].lower()
 
 
 @pytest.mark.asyncio
-async def test_list_reports_empty():
-    """Test listing reports when database is empty."""
-    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-        response = await client.get("/reports/")
-        
-        assert response.status_code == status.HTTP_200_OK
-        data = response.json()
-        assert "reports" in data
-        assert "total" in data
-        assert isinstance(data["reports"], list)
+async def test_download_conditional_get(
+    async_client: AsyncClient, session: AsyncSession
+) -> None:
+    """Test that exports answer 304 until the report changes."""
+    report = await _add_report(session, summary="First draft", status="completed")
+    url = f"/reports/{report.id}/download/markdown"
+
+    response = await async_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["etag"]
+
+    for if_none_match in (etag, etag.removeprefix("W/"), f'"other", {etag}'):
+        response = await async_client.get(url, headers={"If-None-Match": if_none_match})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
+
+    # Updated within the same second as the first render
+    report.summary = "Final version"
+    await session.commit()
+
+    response = await async_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_render_cache(upload_dir, session: AsyncSession) -> None:
+    """Test that rendered reports are reused until the report is updated."""
+    report = await _add_report(session, summary="First draft", status="completed")
+
+    # A render from before exports were versioned
+    legacy_path = upload_dir / "reports" / f"report_{report.id}.md"
+    legacy_path.write_text("Stale")
+
+    md_path = await report_service.generate_markdown_report(session, report.id)
+    rendered_at = md_path.stat().st_mtime_ns
+    assert "First draft" in md_path.read_text()
+
+    # Unchanged report: the file on disk is served as it is
+    assert await report_service.generate_markdown_report(session, report.id) == md_path
+    assert md_path.stat().st_mtime_ns == rendered_at
+
+    # Updated right away, in the same second (and millisecond) as the render
+    report.summary = "Final version"
+    await session.commit()
+
+    new_path = await report_service.generate_markdown_report(session, report.id)
+    assert new_path != md_path
+    assert "Final version" in new_path.read_text()
+    assert list((upload_dir / "reports").iterdir()) == [new_path]
+
+
+@pytest.mark.asyncio
+async def test_render_pdf_replaces_broken_pool(
+    monkeypatch, session: AsyncSession
+) -> None:
+    """Test that a PDF pool with a dead worker is replaced instead of failing forever."""
+    report = await _add_report(session, transcription="Hello", status="transcribed")
+
+    broken = ProcessPoolExecutor(max_workers=1)
+    with pytest.raises(BrokenProcessPool):
+        broken.submit(os._exit, 1).result()
+    monkeypatch.setattr(report_module, "pdf_pool", broken)
+
+    pdf_path = await report_service.generate_pdf_report(session, report.id)
+
+    assert pdf_path.read_bytes().startswith(b"%PDF")
+    assert report_module.pdf_pool is not broken
+    report_module.pdf_pool.shutdown()
+
+
+def _pdf_text(pdf: bytes) -> str:
+    """Text drawn by a ReportLab PDF, its Tj strings joined together."""
+    # ReportLab encodes its streams with /ASCII85Decode /FlateDecode
+    streams = re.findall(rb"stream\r?\n(.*?)~>\s*endstream", pdf, re.DOTALL)
+    content = b"".join(zlib.decompress(base64.a85decode(s)) for s in streams)
+    strings = re.findall(rb"\(((?:\\.|[^\\)])*)\) Tj", content)
+    return b"".join(strings).decode("latin-1")
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_escapes_markup(
+    async_client: AsyncClient, session: AsyncSession
+) -> None:
+    """Test that markup characters of a transcription end up verbatim in the PDF."""
+    transcription = "R&D budget < 5% of <b>revenue"
+    report = await _add_report(session, transcription=transcription, status="transcribed")
+
+    response = await async_client.get(f"/reports/{report.id}/download/pdf")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.content.startswith(b"%PDF")
+    assert "R&D budget < 5% of <b>revenue" in _pdf_text(response.content)
+
+
+@pytest.mark.asyncio
+async def test_stream_summary_nonexistent_report(async_client: AsyncClient) -> None:
+    """Test that streaming a summary fails before the stream starts."""
+    response = await async_client.post("/reports/99999/summarize/stream")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert "not found" in response.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_stream_summary(
+    async_client: AsyncClient, session: AsyncSession, mock_openai
+) -> None:
+    """Test the SSE summary stream and the report it leaves behind."""
+    transcription = mock_openai.transcribe.return_value.text
+    report = await _add_report(session, transcription=transcription, status="transcribed")
+
+    response = await async_client.post(f"/reports/{report.id}/summarize/stream")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    deltas = [data for event, data in events if event == "delta"]
+    assert len(deltas) > 1
+    # Deltas are JSON-encoded strings, together they are the model output
+    streamed = json.loads("".join(json.loads(delta) for delta in deltas))
+    assert streamed["topics"][0]["title"] == "Quarterly roadmap"
+
+    assert events[-1][0] == "summary"
+    summary = json.loads(events[-1][1])
+    assert summary["report_id"] == report.id
+    assert summary["summary"] == streamed["summary"]
+    assert summary["action_items"][0]["assignee"] == "Alice"
+
+    await session.refresh(report)
+    assert report.status == "completed"
+    assert report.summary == streamed["summary"]
+
+
+@pytest.mark.asyncio
+async def test_stream_summary_disconnect(session: AsyncSession, mock_openai) -> None:
+    """Test that an abandoned summary stream does not leave the report summarizing."""
+    transcription = mock_openai.transcribe.return_value.text
+    report = await _add_report(session, transcription=transcription, status="transcribed")
+
+    stream = report_service.stream_summary(session, report)
+    await anext(stream)
+    await stream.aclose()
+
+    await session.refresh(report)
+    assert report.status == "transcribed"
+    assert report.summary is None
+
+
+@pytest.mark.asyncio
+async def test_stream_summary_cancelled(
+    monkeypatch, session: AsyncSession, mock_openai
+) -> None:
+    """Test that a stream cancelled while waiting for the model, as on a client disconnect, resets the report."""
+    transcription = mock_openai.transcribe.return_value.text
+    report = await _add_report(session, transcription=transcription, status="transcribed")
+
+    async def model_stream(transcription: str) -> AsyncIterator[str]:
+        while True:
+            yield '{"summary": '
+            await anyio.sleep(0)  # Waiting for the next chunk
+
+    monkeypatch.setattr(summary_service, "stream_summary", model_stream)
+
+    async def consume() -> None:
+        # Cancelled like the SSE producer task when the client goes away
+        async for _ in stream_summary(report=report, db=session):
+            tg.cancel_scope.cancel()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(consume)
+
+    assert tg.cancel_scope.cancelled_caught
+    await session.refresh(report)
+    assert report.status == "transcribed"
+    assert report.summary is None
+
+
+@pytest.mark.parametrize(
+    "sections",
+    [
+        {"topics": None, "decisions": None, "action_items": None},
+        {"topics": {"title": "Roadmap"}, "decisions": "none", "action_items": 3},
+        {"topics": ["Roadmap", 1], "decisions": [{"who": "Bob"}], "action_items": [None]},
+    ],
+    ids=["null", "not-a-list", "bad-entries"],
+)
+def test_parse_summary_malformed_sections(sections: Dict[str, Any]) -> None:
+    """Test that malformed sections are dropped without losing the summary."""
+    content = json.dumps({"summary": "Short meeting.", **sections})
+
+    result = summary_service.parse_summary(content)
+
+    assert result["summary"] == "Short meeting."
+    assert result["topics"] == result["decisions"] == result["action_items"] == []
+
+
+def test_parse_summary_keeps_valid_entries() -> None:
+    """Test that valid entries survive next to malformed ones."""
+    content = json.dumps({
+        "summary": "Short meeting.",
+        "topics": [{"title": "Roadmap"}, "noise"],
+        "decisions": {"description": "Not a list"},
+        "action_items": [{"assignee": "Alice"}, {"task": "Send the budget"}],
+    })
+
+    result = summary_service.parse_summary(content)
+
+    assert [t.title for t in result["topics"]] == ["Roadmap"]
+    assert result["decisions"] == []
+    assert [a.task for a in result["action_items"]] == ["Send the budget"]
+
+
+@pytest.mark.asyncio
+async def test_summarize_short_transcription(
+    async_client: AsyncClient, session: AsyncSession, mock_openai
+) -> None:
+    """Test that transcriptions below MIN_SUMMARY_WORDS are not sent to GPT."""
+    transcription = "Thanks everyone, see you tomorrow."
+    report = await _add_report(session, transcription=transcription, status="transcribed")
+    completions = mock_openai.complete.await_count
+
+    response = await async_client.post(f"/reports/{report.id}/summarize")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["summary"] == transcription
+    assert data["topics"] == data["decisions"] == data["action_items"] == []
+    assert mock_openai.complete.await_count == completions
+
+
+@pytest.mark.asyncio
+async def test_summarize_min_words_boundary(mock_openai) -> None:
+    """Test that a transcription of exactly MIN_SUMMARY_WORDS words goes to GPT."""
+    transcription = " ".join(["word"] * settings.MIN_SUMMARY_WORDS)
+    completions = mock_openai.complete.await_count
+
+    shorter = await summary_service.generate_summary(transcription.split(" ", 1)[1])
+    assert mock_openai.complete.await_count == completions
+    assert shorter["topics"] == []
+
+    await summary_service.generate_summary(transcription)
+    assert mock_openai.complete.await_count == completions + 1
+
+
+@pytest.mark.asyncio
+async def test_process_reports_batch(
+    monkeypatch, session: AsyncSession, mock_openai
+) -> None:
+    """Test that a failing report doesn't abort the batch or reorder the results."""
+    good = await _add_report(session, file_path="/nonexistent/good.mp3")
+    bad = await _add_report(session, file_path="/nonexistent/bad.mp3")
+
+    def transcribe(file, **kwargs):
+        if file.name == "bad.mp3":
+            raise RuntimeError("corrupt audio")
+        return mock_openai.transcribe.return_value
+
+    monkeypatch.setattr(mock_openai.transcribe, "side_effect", transcribe)
+
+    reports = await report_service.process_reports_batch(
+        session, [bad.id, 99999, good.id]
+    )
+
+    assert [r.id for r in reports] == [bad.id, good.id]
+    assert reports[0].status == "failed"
+    assert "corrupt audio" in reports[0].error_message
+    assert reports[1].status == "completed"
+    assert reports[1].topics[0]["title"] == "Quarterly roadmap"
+    assert reports[1].updated_at >= reports[1].created_at
+
+
+@pytest.mark.asyncio
+async def test_complete_workflow(async_client: AsyncClient, mock_openai) -> None:
+    """Test upload, transcription, summary and download against mocked OpenAI."""
+    transcription = mock_openai.transcribe.return_value.text
+
+    response = await async_client.post(
+        "/reports/upload", files={"file": ("meeting.mp3", os.urandom(64), "audio/mpeg")}
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    report_id = response.json()["id"]
+
+    response = await async_client.post(f"/reports/{report_id}/transcribe")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["transcription"] == transcription
+    assert data["language"] == "en"
+
+    response = await async_client.post(f"/reports/{report_id}/summarize")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["summary"].startswith("The team reviewed")
+    assert data["topics"][0]["title"] == "Quarterly roadmap"
+    assert data["action_items"][0]["assignee"] == "Alice"
+
+    response = await async_client.get(f"/reports/{report_id}")
+    assert response.json()["status"] == "completed"
 
+    response = await async_client.get(f"/reports/{report_id}/download/markdown")
+    assert response.status_code == status.HTTP_200_OK
+    assert "## Action Items" in response.text
+    assert transcription in response.text